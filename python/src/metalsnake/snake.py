@@ -7,7 +7,7 @@ Features include:
 - Magnet power-up functionality
 - Advanced glow and shine visual effects
 - Additional power-ups for varied gameplay
-- Improved particle system with object pooling
+- Vectorized particle system with preallocated NumPy buffers
 - Responsive design adjustments for window resizing
 - Comprehensive logging and error handling
 - Sound synthesis and management with programmatically generated sounds
@@ -20,11 +20,12 @@ import math
 import json
 import os
 import logging
-from typing import Tuple, Set, List, Optional, Dict, Any
+from typing import Tuple, FrozenSet, List, Optional, Dict, Any, Callable, Deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import numpy as np
 import io
+from collections import OrderedDict, deque
 
 # Ensure appdirs is installed for user-specific directories (optional but recommended)
 try:
@@ -34,6 +35,8 @@ except ImportError:
     print("Please install it using 'pip install appdirs'")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 
 ##########################
 # ENUMS AND CONFIG
@@ -57,13 +60,23 @@ class Direction(Enum):
     @property
     def opposite(self) -> 'Direction':
         """Returns the opposite direction, used for preventing 180-degree turns"""
-        opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }
-        return opposites[self]
+        return _OPPOSITE_DIRECTIONS[self]
+
+# Opposite lookup table, built once instead of on every Direction.opposite call
+_OPPOSITE_DIRECTIONS: Dict[Direction, Direction] = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+# Grid step (dx, dy) for each direction
+_DIRECTION_DELTAS: Dict[Direction, Tuple[int, int]] = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0)
+}
 
 class PowerUpType(Enum):
     """Different types of power-ups available in the game"""
@@ -95,12 +108,16 @@ class GameConfig:
     PARTICLE_COUNT: int = 12
     PARTICLE_SPEED: float = 3.0
     PARTICLE_LIFETIME: int = 30
+    MAX_PARTICLES: int = 512  # Size of the preallocated particle buffer
     
     # Scoring
     MAX_SCORES: int = 5
     SCORE_THRESHOLD: int = 50  # Points needed to increase speed
     SPEED_INCREMENT: int = 2    # How much to increase speed each threshold
     
+    # Text
+    FONT_SIZES: Tuple[int, ...] = (20, 24, 28, 30, 40, 48)  # Sizes used by the UI, preloaded at startup
+    
     # Power-up system
     POWERUP_TYPES: List[PowerUpType] = field(default_factory=lambda: [
         PowerUpType.SPEED_BOOST,
@@ -135,11 +152,15 @@ class GameConfig:
 ##########################
 
 class ResourceManager:
+    TEXT_CACHE_SIZE = 256  # Maximum number of rendered text surfaces kept
+
     def __init__(self, config: GameConfig):
         """Initialize the resource manager and load initial resources"""
         self.config = config
         self._background: Optional[pygame.Surface] = None
+        self._scaled_background: Dict[Tuple[int, int], pygame.Surface] = {}
         self._font_cache: Dict[int, pygame.font.Font] = {}
+        self._text_cache: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
         self.logger = logging.getLogger(__name__)
 
         # Determine base paths
@@ -173,17 +194,55 @@ class ResourceManager:
                 self._background = None
         return self._background
 
+    def get_background_scaled(self, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """
+        Get the background scaled to the given size.
+        The scaled copy is cached until the window is resized.
+        """
+        scaled = self._scaled_background.get(size)
+        if scaled is None:
+            background = self.get_background()
+            if background is None:
+                return None
+            # The background is opaque, so drop the alpha channel for faster blits
+            scaled = pygame.transform.smoothscale(background, size).convert()
+            self._scaled_background[size] = scaled
+        return scaled
+
+    def flush_scaled_background(self) -> None:
+        """Drop cached scaled backgrounds, e.g. after a window resize"""
+        self._scaled_background.clear()
+
     def get_font(self, size: int) -> pygame.font.Font:
         """Get or create a font of the specified size"""
         if size not in self._font_cache:
-            try:
-                self._font_cache[size] = pygame.font.SysFont(None, size)
-            except Exception as e:
-                self.logger.error(f"Failed to load font size {size}: {e}")
-                # Fallback to default font
-                self._font_cache[size] = pygame.font.Font(None, size)
+            # SysFont(None, ...) resolves to the default font anyway; loading it
+            # directly skips the system font scan
+            self._font_cache[size] = pygame.font.Font(None, size)
         return self._font_cache[size]
 
+    def preload_fonts(self, sizes: Tuple[int, ...]) -> None:
+        """Load fonts up front so the first frame using a size doesn't stall"""
+        for size in sizes:
+            self.get_font(size)
+
+    def render_text(self, text: str, size: int, color: Tuple[int, ...],
+                    antialias: bool = True) -> pygame.Surface:
+        """
+        Render text through a small LRU cache.
+        Identical strings are rasterized once and reused on later frames.
+        """
+        key = (text, size, tuple(color), antialias)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+        surface = self.get_font(size).render(text, antialias, color)
+        self._text_cache[key] = surface
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)  # Evict least recently used
+        return surface
+
     def resource_path(self, relative_path: str) -> str:
         """Get absolute path to resource for both dev and PyInstaller modes"""
         return os.path.join(self.base_path, "resources", relative_path)
@@ -207,7 +266,9 @@ class ResourceManager:
     def cleanup(self) -> None:
         """Release all loaded resources"""
         self._background = None
+        self._scaled_background.clear()
         self._font_cache.clear()
+        self._text_cache.clear()
         self.logger.info("Resources cleaned up")
 
 
@@ -215,72 +276,102 @@ class ResourceManager:
 # PARTICLE SYSTEM
 ##########################
 
-class Particle:
+@dataclass
+class ParticleArray:
     """
-    Individual particle with physics-based movement.
-    Represents a single particle in the particle effect system.
+    Structure-of-arrays storage for particles.
+    Live particles occupy indices [0:n_active]; the remaining slots are
+    preallocated so emitting never allocates.
     """
-    def __init__(self, x: float, y: float, color: Tuple[int, int, int], config: GameConfig):
-        self.config = config
-        self.color = color
-        self.reset(x, y)
-        
-    def reset(self, x: float, y: float) -> None:
-        """Reset particle to initial state with new position"""
-        self.x = float(x)
-        self.y = float(y)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(self.config.PARTICLE_SPEED * 0.5,
-                               self.config.PARTICLE_SPEED)
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
-        self.life = self.config.PARTICLE_LIFETIME
-        
-    def update(self) -> None:
-        """Update particle position and lifetime"""
-        self.x += self.dx
-        self.y += self.dy
-        self.life -= 1
-        
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw particle with size based on remaining lifetime"""
-        radius = max(1, self.life // 6)
-        pygame.draw.circle(surface, self.color,
-                           (int(self.x), int(self.y)), radius)
+    capacity: int
+    x: np.ndarray = field(init=False)
+    y: np.ndarray = field(init=False)
+    dx: np.ndarray = field(init=False)
+    dy: np.ndarray = field(init=False)
+    life: np.ndarray = field(init=False)
+    color: np.ndarray = field(init=False)
+    n_active: int = 0
+
+    def __post_init__(self):
+        self.x = np.empty(self.capacity, dtype=np.float32)
+        self.y = np.empty(self.capacity, dtype=np.float32)
+        self.dx = np.empty(self.capacity, dtype=np.float32)
+        self.dy = np.empty(self.capacity, dtype=np.float32)
+        self.life = np.empty(self.capacity, dtype=np.int16)
+        self.color = np.empty((self.capacity, 3), dtype=np.uint8)
 
 class ParticleSystem:
     """
     Manages particle effects for visual feedback.
-    Uses object pooling to reduce garbage collection.
+    Particles are stored as NumPy arrays so the per-frame physics update
+    is a few vectorized operations rather than a loop over objects.
     """
     def __init__(self, config: GameConfig):
         self.config = config
-        self.particles: List[Particle] = []
-        self.particle_pool: List[Particle] = []
+        self.particles = ParticleArray(self.config.MAX_PARTICLES)
+        self._rng = np.random.default_rng()
         
     def emit(self, x: float, y: float, count: int, color: Tuple[int, int, int]) -> None:
         """Emit a burst of particles at the specified position with given color"""
-        for _ in range(count):
-            if self.particle_pool:
-                particle = self.particle_pool.pop()
-                particle.color = color  # Update color to match power-up
-                particle.reset(x, y)
-            else:
-                particle = Particle(x, y, color, self.config)
-            self.particles.append(particle)
+        p = self.particles
+        count = min(count, p.capacity - p.n_active)
+        if count <= 0:
+            return  # Particle buffer is full
+
+        start, end = p.n_active, p.n_active + count
+        # Sample every angle and speed of the burst in one RNG call
+        angles, speeds = self._rng.uniform(
+            (0.0, self.config.PARTICLE_SPEED * 0.5),
+            (2 * math.pi, self.config.PARTICLE_SPEED),
+            (count, 2)
+        ).T
+        p.x[start:end] = x
+        p.y[start:end] = y
+        # Write velocities straight into the particle arrays
+        dx, dy = p.dx[start:end], p.dy[start:end]
+        np.cos(angles, out=dx, casting='same_kind')
+        np.sin(angles, out=dy, casting='same_kind')
+        dx *= speeds
+        dy *= speeds
+        p.life[start:end] = self.config.PARTICLE_LIFETIME
+        p.color[start:end] = color
+        p.n_active = end
             
     def update_and_draw(self, surface: pygame.Surface) -> None:
         """Update particle positions and draw them"""
-        dead_particles = []
-        for particle in self.particles:
-            particle.update()
-            particle.draw(surface)
-            if particle.life <= 0:
-                dead_particles.append(particle)
-                
-        for dead in dead_particles:
-            self.particles.remove(dead)
-            self.particle_pool.append(dead)
+        p = self.particles
+        n = p.n_active
+        if n == 0:
+            return
+
+        p.x[:n] += p.dx[:n]
+        p.y[:n] += p.dy[:n]
+        p.life[:n] -= 1
+
+        # Radius shrinks with remaining lifetime; only the draw calls stay in Python
+        radii = np.maximum(1, p.life[:n] // 6)
+        for px, py, radius, color in zip(p.x[:n].astype(np.int32).tolist(),
+                                         p.y[:n].astype(np.int32).tolist(),
+                                         radii.tolist(),
+                                         p.color[:n].tolist()):
+            pygame.draw.circle(surface, color, (px, py), radius)
+
+        # Compact surviving particles to the front of the arrays
+        alive = p.life[:n] > 0
+        new_n = int(np.count_nonzero(alive))
+        if new_n == n:
+            return  # Nothing died this frame
+        n_dead = n - new_n
+        # All particles share a lifetime, so the oldest (front) ones die first;
+        # a single slice shift then replaces the boolean gather
+        keep = slice(n_dead, n) if not alive[:n_dead].any() else alive
+        for arr in (p.x, p.y, p.dx, p.dy, p.life, p.color):
+            arr[:new_n] = arr[:n][keep]
+        p.n_active = new_n
+
+    def clear(self) -> None:
+        """Remove all live particles"""
+        self.particles.n_active = 0
 
 
 ##########################
@@ -299,6 +390,7 @@ class ScoreManager:
             "classic": [],
             "obstacles": []
         }
+        self.version = 0  # Bumped whenever the high score tables change
         self.load_scores()
         
     def load_scores(self) -> None:
@@ -308,6 +400,7 @@ class ScoreManager:
             try:
                 with open(highscores_path, 'r') as f:
                     self.highscores = json.load(f)
+                self.version += 1
                 logging.info("High scores loaded successfully.")
             except Exception as e:
                 logging.error(f"Error loading highscores: {e}")
@@ -332,6 +425,7 @@ class ScoreManager:
         self.highscores[mode].append({"name": name, "score": score})
         self.highscores[mode].sort(key=lambda x: x["score"], reverse=True)
         self.highscores[mode] = self.highscores[mode][:self.config.MAX_SCORES]
+        self.version += 1
         self.save_scores()
 
 
@@ -344,11 +438,17 @@ class PowerUp:
     Represents a power-up entity in the game.
     Handles power-up type, position, and visual representation.
     """
+    __slots__ = ('config', 'x', 'y', 'type', 'active', 'duration', 'remaining_duration')
+
     def __init__(self, x: int, y: int, powerup_type: PowerUpType, config: GameConfig):
+        self.config = config
+        self.reset(x, y, powerup_type)
+
+    def reset(self, x: int, y: int, powerup_type: PowerUpType) -> None:
+        """Reset power-up to a fresh state so pooled instances can be reused"""
         self.x = x
         self.y = y
         self.type = powerup_type
-        self.config = config
         self.active = False
         self.duration = self.config.POWERUP_DURATION
         self.remaining_duration = self.duration  # New attribute
@@ -359,66 +459,101 @@ class PowerUp:
     
     def apply(self, game: 'Game') -> None:
         """Apply the power-up effect to the game"""
-        if self.type == PowerUpType.SPEED_BOOST:
-            game.config.GAME_SPEED += 5  # Increase game speed
-            game.powerup_manager.active_powerups[self.type] = self.duration  # Correct reference
-            game.sound_manager.play_powerup_sound(self.type)
-            logging.info("Speed Boost activated!")
-        elif self.type == PowerUpType.INVINCIBILITY:
-            game.snake.invincible = True
-            game.powerup_manager.active_powerups[self.type] = self.duration  # Correct reference
-            game.sound_manager.play_powerup_sound(self.type)
-            logging.info("Invincibility activated!")
-        elif self.type == PowerUpType.SCORE_MULTIPLIER:
-            game.score_multiplier += 1  # Increment multiplier
-            game.powerup_manager.active_powerups[self.type] = self.duration  # Correct reference
-            game.sound_manager.play_powerup_sound(self.type)
-            logging.info(f"Score Multiplier activated! Current multiplier: x{game.score_multiplier}")
-        elif self.type == PowerUpType.MAGNET:
-            game.powerup_manager.magnet_active = True
-            game.powerup_manager.active_powerups[self.type] = self.duration
-            game.sound_manager.play_powerup_sound(self.type)
-            logging.info("Magnet activated!")
-        elif self.type == PowerUpType.SHRINK:
-            if len(game.snake.body) > 3:
-                game.snake.body = game.snake.body[:-2]  # Remove two segments
-                game.score = max(0, game.score - 5)  # Penalize score slightly
-                game.powerup_manager.active_powerups[self.type] = self.duration
-                game.sound_manager.play_powerup_sound(self.type)
-                logging.info("Shrink activated! Snake size reduced.")
+        _POWERUP_APPLY_EFFECTS[self.type](self, game)
     
     def expire(self, game: 'Game') -> None:
         """Expire the power-up effect from the game"""
-        if self.type == PowerUpType.SPEED_BOOST:
-            game.config.GAME_SPEED -= 5  # Revert game speed
-            if self.type in game.powerup_manager.active_powerups:
-                del game.powerup_manager.active_powerups[self.type]
-            logging.info("Speed Boost expired!")
-        elif self.type == PowerUpType.INVINCIBILITY:
-            game.snake.invincible = False
-            if self.type in game.powerup_manager.active_powerups:
-                del game.powerup_manager.active_powerups[self.type]
-            logging.info("Invincibility expired!")
-        elif self.type == PowerUpType.SCORE_MULTIPLIER:
-            game.score_multiplier = max(1, game.score_multiplier - 1)  # Decrement multiplier but not below 1
-            if self.type in game.powerup_manager.active_powerups:
-                del game.powerup_manager.active_powerups[self.type]
-            logging.info(f"Score Multiplier expired! Current multiplier: x{game.score_multiplier}")
-        elif self.type == PowerUpType.MAGNET:
-            game.powerup_manager.magnet_active = False
-            if self.type in game.powerup_manager.active_powerups:
-                del game.powerup_manager.active_powerups[self.type]
-            logging.info("Magnet expired!")
-        elif self.type == PowerUpType.SHRINK:
-            if self.type in game.powerup_manager.active_powerups:
-                del game.powerup_manager.active_powerups[self.type]
-            logging.info("Shrink expired!")
+        self.expire_type(game, self.type)
+
+    @staticmethod
+    def expire_type(game: 'Game', powerup_type: PowerUpType) -> None:
+        """Expire the effect of a power-up type; needs no PowerUp instance"""
+        game.powerup_manager.active_powerups.pop(powerup_type, None)
+        _POWERUP_EXPIRE_EFFECTS[powerup_type](game)
     
     def update_timer(self) -> None:
         """Update the remaining duration of the power-up"""
         if self.remaining_duration > 0:
             self.remaining_duration -= 1
 
+# Power-up effects, dispatched by type from PowerUp.apply and PowerUp.expire
+
+def _start_powerup(powerup: PowerUp, game: 'Game') -> None:
+    """Start the effect timer and play the collection sound"""
+    game.powerup_manager.active_powerups[powerup.type] = powerup.duration
+    game.sound_manager.play_powerup_sound(powerup.type)
+
+def _apply_speed_boost(powerup: PowerUp, game: 'Game') -> None:
+    game.config.GAME_SPEED += 5  # Increase game speed
+    _start_powerup(powerup, game)
+    logger.info("Speed Boost activated!")
+
+def _apply_invincibility(powerup: PowerUp, game: 'Game') -> None:
+    game.snake.invincible = True
+    _start_powerup(powerup, game)
+    logger.info("Invincibility activated!")
+
+def _apply_score_multiplier(powerup: PowerUp, game: 'Game') -> None:
+    game.score_multiplier += 1  # Increment multiplier
+    _start_powerup(powerup, game)
+    logger.info("Score Multiplier activated! Current multiplier: x%d", game.score_multiplier)
+
+def _apply_magnet(powerup: PowerUp, game: 'Game') -> None:
+    game.powerup_manager.magnet_active = True
+    _start_powerup(powerup, game)
+    logger.info("Magnet activated!")
+
+def _apply_shrink(powerup: PowerUp, game: 'Game') -> None:
+    if len(game.snake.body) > 3:
+        game.snake.shrink(2)  # Remove two segments
+        game.score = max(0, game.score - 5)  # Penalize score slightly
+        _start_powerup(powerup, game)
+        logger.info("Shrink activated! Snake size reduced.")
+
+def _expire_speed_boost(game: 'Game') -> None:
+    game.config.GAME_SPEED -= 5  # Revert game speed
+    logger.info("Speed Boost expired!")
+
+def _expire_invincibility(game: 'Game') -> None:
+    game.snake.invincible = False
+    logger.info("Invincibility expired!")
+
+def _expire_score_multiplier(game: 'Game') -> None:
+    game.score_multiplier = max(1, game.score_multiplier - 1)  # Decrement multiplier but not below 1
+    logger.info("Score Multiplier expired! Current multiplier: x%d", game.score_multiplier)
+
+def _expire_magnet(game: 'Game') -> None:
+    game.powerup_manager.magnet_active = False
+    logger.info("Magnet expired!")
+
+def _expire_shrink(game: 'Game') -> None:
+    logger.info("Shrink expired!")
+
+_POWERUP_APPLY_EFFECTS: Dict[PowerUpType, Callable[[PowerUp, 'Game'], None]] = {
+    PowerUpType.SPEED_BOOST: _apply_speed_boost,
+    PowerUpType.INVINCIBILITY: _apply_invincibility,
+    PowerUpType.SCORE_MULTIPLIER: _apply_score_multiplier,
+    PowerUpType.MAGNET: _apply_magnet,
+    PowerUpType.SHRINK: _apply_shrink
+}
+
+_POWERUP_EXPIRE_EFFECTS: Dict[PowerUpType, Callable[['Game'], None]] = {
+    PowerUpType.SPEED_BOOST: _expire_speed_boost,
+    PowerUpType.INVINCIBILITY: _expire_invincibility,
+    PowerUpType.SCORE_MULTIPLIER: _expire_score_multiplier,
+    PowerUpType.MAGNET: _expire_magnet,
+    PowerUpType.SHRINK: _expire_shrink
+}
+
+# Particle colors emitted when a power-up of each type is collected
+_POWERUP_PARTICLE_COLORS: Dict[PowerUpType, Tuple[int, int, int]] = {
+    PowerUpType.SPEED_BOOST: (255, 255, 0),       # Yellow
+    PowerUpType.INVINCIBILITY: (0, 255, 255),     # Cyan
+    PowerUpType.SCORE_MULTIPLIER: (255, 0, 255),  # Magenta
+    PowerUpType.MAGNET: (0, 255, 0),              # Green
+    PowerUpType.SHRINK: (255, 165, 0)             # Orange
+}
+
 class PowerUpManager:
     """
     Manages power-up spawning, active power-ups, and their effects.
@@ -427,6 +562,8 @@ class PowerUpManager:
         self.config = config
         self.active_powerups: Dict[PowerUpType, int] = {}
         self.powerups: List[PowerUp] = []
+        self.powerup_by_pos: Dict[Tuple[int, int], PowerUp] = {}  # Index of powerups by grid cell
+        self._powerup_pool: List[PowerUp] = []  # Collected power-ups kept for reuse
         self.spawn_timer = 0
         self.magnet_active: bool = False  # Tracks if magnet is active
     
@@ -437,9 +574,14 @@ class PowerUpManager:
 
         powerup_type = random.choice(self.config.POWERUP_TYPES)
         x, y = game.get_random_position(include_powerups=True)
-        powerup = PowerUp(x, y, powerup_type, self.config)
+        if self._powerup_pool:
+            powerup = self._powerup_pool.pop()
+            powerup.reset(x, y, powerup_type)
+        else:
+            powerup = PowerUp(x, y, powerup_type, self.config)
         self.powerups.append(powerup)
-        logging.info(f"Spawned power-up: {powerup.type.name} at ({x}, {y})")
+        self.powerup_by_pos[(x, y)] = powerup
+        logger.info("Spawned power-up: %s at (%d, %d)", powerup.type.name, x, y)
     
     def update(self, game: 'Game') -> None:
         """Update power-ups, spawn new ones, and handle expiration"""
@@ -450,44 +592,51 @@ class PowerUpManager:
             self.spawn_timer = 0
 
         # Update active power-up durations
-        for powerup_type in list(self.active_powerups.keys()):  # Create a copy of keys to modify dict during iteration
-            self.active_powerups[powerup_type] -= 1
-            if self.active_powerups[powerup_type] <= 0:
-                # Create a temporary PowerUp object to handle expiration
-                temp_powerup = PowerUp(0, 0, powerup_type, self.config)
-                temp_powerup.expire(game)
-                logging.info(f"Power-up {powerup_type.name} expired.")
+        if self.active_powerups:
+            # Overwriting existing keys is safe while iterating; removals wait until after
+            expired = None
+            for powerup_type, remaining in self.active_powerups.items():
+                remaining -= 1
+                self.active_powerups[powerup_type] = remaining
+                if remaining <= 0:
+                    if expired is None:
+                        expired = []
+                    expired.append(powerup_type)
+            if expired:
+                for powerup_type in expired:
+                    PowerUp.expire_type(game, powerup_type)
+                    logger.info("Power-up %s expired.", powerup_type.name)
     
         # Check for power-up collection
+        if not self.powerup_by_pos:
+            return  # Nothing on the field to collect
         head = game.snake.head_position()
-        for powerup in self.powerups[:]:  # Use slice copy to safely modify during iteration
-            if head == powerup.position():
-                powerup.apply(game)
-                self.powerups.remove(powerup)
-                game.score += 5 * game.score_multiplier  # Bonus for collecting power-up
-                # Emit particles at power-up location upon collection
-                game.particles.emit(
-                    powerup.x * game.cell_size + game.cell_size // 2 + game.renderer.x_offset,
-                    powerup.y * game.cell_size + game.cell_size // 2 + game.renderer.y_offset,
-                    game.config.PARTICLE_COUNT,
-                    self.get_powerup_particle_color(powerup.type)
-                )
-                logging.info(f"Power-up {powerup.type.name} collected by player.")
+        powerup = self.powerup_by_pos.pop(head, None)
+        if powerup is not None:
+            powerup.apply(game)
+            self.powerups.remove(powerup)
+            game.score += 5 * game.score_multiplier  # Bonus for collecting power-up
+            # Emit particles at power-up location upon collection
+            game.particles.emit(
+                powerup.x * game.cell_size + game.cell_size // 2 + game.renderer.x_offset,
+                powerup.y * game.cell_size + game.cell_size // 2 + game.renderer.y_offset,
+                game.config.PARTICLE_COUNT,
+                self.get_powerup_particle_color(powerup.type)
+            )
+            logger.info("Power-up %s collected by player.", powerup.type.name)
+            self._powerup_pool.append(powerup)
     
+    def clear(self) -> None:
+        """Remove all power-ups from the field and cancel active effects"""
+        self._powerup_pool.extend(self.powerups)
+        self.powerups.clear()
+        self.powerup_by_pos.clear()
+        self.active_powerups.clear()
+        self.magnet_active = False
+
     def get_powerup_particle_color(self, powerup_type: PowerUpType) -> Tuple[int, int, int]:
         """Return the color for particles emitted from a power-up"""
-        if powerup_type == PowerUpType.SPEED_BOOST:
-            return (255, 255, 0)  # Yellow
-        elif powerup_type == PowerUpType.INVINCIBILITY:
-            return (0, 255, 255)  # Cyan
-        elif powerup_type == PowerUpType.SCORE_MULTIPLIER:
-            return (255, 0, 255)  # Magenta
-        elif powerup_type == PowerUpType.MAGNET:
-            return (0, 255, 0)    # Green
-        elif powerup_type == PowerUpType.SHRINK:
-            return (255, 165, 0)  # Orange
-        else:
-            return (255, 255, 255)  # White
+        return _POWERUP_PARTICLE_COLORS.get(powerup_type, (255, 255, 255))  # White by default
     
     def draw(self, surface: pygame.Surface, cell_size: int, frame_count: int, particle_system: ParticleSystem) -> None:
         """Draw all active power-ups with enhanced visuals and animations"""
@@ -511,14 +660,30 @@ class SoundSynthesizer:
         # Standard audio parameters
         self.sample_rate = 44100  # CD quality audio
         self.amplitude = 0.3      # Default volume (reduced to prevent clipping)
+        self._scratch: Dict[int, np.ndarray] = {}  # Reusable work buffers keyed by length
+        self._rng = np.random.default_rng()
+
+    def _scratch_buffer(self, num_samples: int) -> np.ndarray:
+        """
+        Get a reusable float32 work buffer of the given length.
+        Only for intermediates; the contents are overwritten by the next user.
+        """
+        buffer = self._scratch.get(num_samples)
+        if buffer is None:
+            buffer = np.empty(num_samples, dtype=np.float32)
+            self._scratch[num_samples] = buffer
+        return buffer
     
     def create_sine_wave(self, frequency: float, duration: float) -> np.ndarray:
         """
         Creates a sine wave of given frequency and duration.
         This is the most basic building block of sound synthesis.
         """
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        return np.sin(2 * math.pi * frequency * t)
+        # At a fixed frequency the phase advances by a constant step per sample,
+        # so build it directly instead of going through a time array
+        phase = np.arange(int(self.sample_rate * duration), dtype=np.float32)
+        phase *= 2 * math.pi * frequency / self.sample_rate
+        return np.sin(phase, out=phase)
     
     def apply_envelope(self, samples: np.ndarray, attack: float = 0.1, 
                       decay: float = 0.1, sustain: float = 0.7,
@@ -528,37 +693,49 @@ class SoundSynthesizer:
         This shapes the amplitude over time to create more natural sounds.
         """
         total_length = len(samples)
-        envelope = np.ones(total_length)
+        # Every sample is written by exactly one segment, so skip the initial fill
+        envelope = np.empty(total_length, dtype=samples.dtype)
         
         # Calculate segment lengths
         attack_len = int(attack * total_length)
         decay_len = int(decay * total_length)
         release_len = int(release * total_length)
         sustain_len = total_length - attack_len - decay_len - release_len
+        sustain_start = attack_len + decay_len
+        release_start = sustain_start + sustain_len
         
         # Create envelope segments
-        envelope[:attack_len] = np.linspace(0, 1, attack_len)
-        envelope[attack_len:attack_len + decay_len] = np.linspace(1, sustain, decay_len)
-        envelope[attack_len + decay_len:-release_len] = sustain
-        envelope[-release_len:] = np.linspace(sustain, 0, release_len)
+        envelope[:attack_len] = np.linspace(0, 1, attack_len, dtype=samples.dtype)
+        envelope[attack_len:sustain_start] = np.linspace(1, sustain, decay_len, dtype=samples.dtype)
+        envelope[sustain_start:release_start].fill(sustain)
+        envelope[release_start:] = np.linspace(sustain, 0, release_len, dtype=samples.dtype)
         
-        return samples * envelope
+        # Reuse the envelope buffer for the result instead of allocating another
+        return np.multiply(samples, envelope, out=envelope)
     
     def create_noise(self, duration: float) -> np.ndarray:
         """
         Creates white noise, useful for percussive and texture sounds.
         """
-        samples = np.random.uniform(-1, 1, int(self.sample_rate * duration))
+        # Draw float32 directly in [0, 1) and shift to [-1, 1) in place
+        samples = self._rng.random(int(self.sample_rate * duration), dtype=np.float32)
+        samples *= 2
+        samples -= 1
         return samples
     
     def apply_lowpass_filter(self, samples: np.ndarray, cutoff: float) -> np.ndarray:
         """
         Applies a simple lowpass filter to smooth out harsh frequencies.
         """
-        # Simple moving average filter
+        # Simple moving average filter, computed from a running sum in O(N)
         window_size = int(self.sample_rate / cutoff)
-        window = np.ones(window_size) / window_size
-        return np.convolve(samples, window, mode='same')
+        # Zero-pad so the output lines up with np.convolve(..., mode='same')
+        pad_right = (window_size - 1) // 2
+        pad_left = window_size - 1 - pad_right
+        running = np.zeros(len(samples) + window_size, dtype=samples.dtype)
+        running[pad_left + 1:pad_left + 1 + len(samples)] = samples
+        np.cumsum(running, out=running)
+        return (running[window_size:] - running[:-window_size]) / window_size
     
     def create_powerup_sound(self) -> pygame.mixer.Sound:
         """
@@ -566,23 +743,30 @@ class SoundSynthesizer:
         Combines multiple frequencies with pitch modulation.
         """
         duration = 0.5
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-        
+        num_samples = int(self.sample_rate * duration)
+        t = np.linspace(0, duration, num_samples, False, dtype=np.float32)
+
         # Create ascending frequency
         freq_start = 220
         freq_end = 880
-        frequency = np.linspace(freq_start, freq_end, len(t))
-        
+        frequency = np.linspace(freq_start, freq_end, num_samples, dtype=np.float32)
+
+        # Base phase (f * t) shared by the main tone and its harmonics
+        phase = np.multiply(frequency, t, out=frequency)
+        combined = np.empty(num_samples, dtype=np.float32)
+        scratch = self._scratch_buffer(num_samples)
+
         # Generate main tone with frequency modulation
-        main_tone = np.sin(2 * math.pi * frequency * t)
-        
-        # Add harmonics for richness
-        harmonic1 = 0.5 * np.sin(4 * math.pi * frequency * t)
-        harmonic2 = 0.25 * np.sin(6 * math.pi * frequency * t)
-        
-        # Combine waves
-        combined = main_tone + harmonic1 + harmonic2
-        
+        np.multiply(phase, 2 * math.pi, out=scratch)
+        np.sin(scratch, out=combined)
+
+        # Add harmonics for richness, accumulating in place
+        for multiple, weight in ((4, 0.5), (6, 0.25)):
+            np.multiply(phase, multiple * math.pi, out=scratch)
+            np.sin(scratch, out=scratch)
+            scratch *= weight
+            combined += scratch
+
         # Apply envelope for smooth start/end
         sound = self.apply_envelope(combined, attack=0.1, decay=0.1, sustain=0.6, release=0.2)
         
@@ -602,11 +786,11 @@ class SoundSynthesizer:
         filtered_noise = self.apply_lowpass_filter(noise, 1000)
         
         # Add subtle sine wave for tone
-        t = np.linspace(0, duration, len(filtered_noise), False)
-        tone = 0.3 * np.sin(2 * math.pi * 200 * t)
+        tone = self.create_sine_wave(200, duration)
+        tone *= 0.3
         
         # Combine and shape
-        combined = filtered_noise + tone
+        combined = np.add(filtered_noise, tone, out=filtered_noise)
         sound = self.apply_envelope(combined, attack=0.05, decay=0.05, sustain=0.5, release=0.4)
         
         return self.create_pygame_sound(combined)
@@ -620,12 +804,13 @@ class SoundSynthesizer:
         frequencies = [440, 880, 1320]  # Root note and harmonics
         amplitudes = [1.0, 0.5, 0.25]   # Decreasing amplitude for harmonics
         
-        combined = np.zeros(int(self.sample_rate * duration))
+        combined = np.zeros(int(self.sample_rate * duration), dtype=np.float32)
         
         # Add harmonics
         for freq, amp in zip(frequencies, amplitudes):
             wave = self.create_sine_wave(freq, duration)
-            combined += amp * wave
+            wave *= amp
+            combined += wave
         
         # Shape the sound with quick attack and decay
         sound = self.apply_envelope(combined, attack=0.05, decay=0.15, sustain=0.6, release=0.2)
@@ -638,24 +823,32 @@ class SoundSynthesizer:
         Combines multiple descending tones with reverb effect.
         """
         duration = 1.0
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
+        t = np.linspace(0, duration, int(self.sample_rate * duration), False, dtype=np.float32)
         
         # Create descending frequencies
         freq_start = 440
         freq_end = 110
-        frequency = np.linspace(freq_start, freq_end, len(t))
+        frequency = np.linspace(freq_start, freq_end, len(t), dtype=np.float32)
+        phase = np.multiply(frequency, t, out=frequency)
+        combined = np.empty(len(t), dtype=np.float32)
+        scratch = self._scratch_buffer(len(t))
         
         # Generate main tone
-        main_tone = np.sin(2 * math.pi * frequency * t)
+        np.multiply(phase, 2 * math.pi, out=scratch)
+        np.sin(scratch, out=combined)
         
         # Add lower octave
-        low_tone = 0.5 * np.sin(math.pi * frequency * t)
+        np.multiply(phase, math.pi, out=scratch)
+        np.sin(scratch, out=scratch)
+        scratch *= 0.5
+        combined += scratch
         
         # Add noise for texture
-        noise = 0.1 * self.create_noise(duration)
+        noise = self.create_noise(duration)
+        noise *= 0.1
         
         # Combine everything
-        combined = main_tone + low_tone + noise
+        combined += noise
         
         # Apply dramatic envelope
         sound = self.apply_envelope(combined, attack=0.1, decay=0.3, sustain=0.4, release=0.2)
@@ -667,11 +860,12 @@ class SoundSynthesizer:
         Converts numpy samples to a Pygame sound object.
         Handles audio scaling and conversion to the correct format.
         """
-        # Normalize to prevent clipping
-        samples = np.int16(samples * 32767 * self.amplitude)
+        # Scale to the 16-bit range in place and clamp so loud peaks don't wrap
+        samples = np.multiply(samples, 32767 * self.amplitude, out=samples)
+        np.clip(samples, -32767, 32767, out=samples)
         
         # Create a Python bytes buffer
-        buffer = samples.tobytes()
+        buffer = samples.astype(np.int16).tobytes()
         
         # Create Pygame sound from buffer
         sound = pygame.mixer.Sound(buffer=buffer)
@@ -712,6 +906,14 @@ class SoundManager:
         self.master_volume = 0.7
         self.music_volume = 0.3  # Reduced music volume
         self.sfx_volume = 0.5
+        # Combined gains, recomputed only when a volume setting changes
+        self._sfx_gain = self.master_volume * self.sfx_volume
+        self._music_gain: Optional[float] = None
+        # Volume last applied to each cached sound, to skip redundant set_volume calls
+        self._last_volume: Dict[str, float] = {}
+        # Music state tracked here instead of querying the mixer each time
+        self._music_loaded = False
+        self.music_playing = False
         
         # Movement sound timer to prevent too frequent sounds
         self.last_movement_sound = 0
@@ -726,8 +928,10 @@ class SoundManager:
             music_path = self.resource_manager.resource_path(os.path.join("audio", "MidnightCarnage.mp3"))
             if os.path.exists(music_path):
                 pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+                self._apply_music_volume()
                 pygame.mixer.music.play(-1)  # Loop indefinitely
+                self._music_loaded = True
+                self.music_playing = True
                 self.logger.info("Background music started successfully")
             else:
                 self.logger.warning("Background music file not found")
@@ -741,9 +945,11 @@ class SoundManager:
         if sound is None:
             return
         
-        # Apply volume settings
-        final_volume = self.master_volume * self.sfx_volume * volume
-        sound.set_volume(final_volume)
+        # Apply volume settings; pygame only resolves to 1/128 steps anyway
+        final_volume = self._sfx_gain * volume
+        if abs(self._last_volume.get(sound_name, -1.0) - final_volume) >= 1 / 128:
+            sound.set_volume(final_volume)
+            self._last_volume[sound_name] = final_volume
         
         # Play on specified channel or any free one
         if channel and not channel.get_busy():
@@ -771,7 +977,7 @@ class SoundManager:
     
     def play_game_over_sound(self) -> None:
         """Play game over sound and pause background music"""
-        pygame.mixer.music.pause()  # Pause background music
+        self._pause_music()  # Pause background music
         self.play_sound('game_over', self.effect_channel, volume=0.7)
     
     def play_menu_sound(self, action: str) -> None:
@@ -785,38 +991,61 @@ class SoundManager:
     
     def resume_music(self) -> None:
         """Resume background music playback"""
-        pygame.mixer.music.unpause()
-        pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+        self._unpause_music()
+        self._apply_music_volume()
+
+    def _pause_music(self) -> None:
+        """Pause the music unless it is already paused"""
+        if self.music_playing:
+            pygame.mixer.music.pause()
+            self.music_playing = False
+
+    def _unpause_music(self) -> None:
+        """Unpause the music if it is loaded and currently paused"""
+        if self._music_loaded and not self.music_playing:
+            pygame.mixer.music.unpause()
+            self.music_playing = True
+
+    def _apply_music_volume(self) -> None:
+        """Push the music volume to the mixer if it changed"""
+        gain = self.master_volume * self.music_volume
+        if gain != self._music_gain:
+            pygame.mixer.music.set_volume(gain)
+            self._music_gain = gain
     
     def set_master_volume(self, volume: float) -> None:
         """Set master volume level and update all active sounds"""
         self.master_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+        self._sfx_gain = self.master_volume * self.sfx_volume
+        self._apply_music_volume()
     
     def set_music_volume(self, volume: float) -> None:
         """Set background music volume"""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.master_volume * self.music_volume)
+        self._apply_music_volume()
         logging.info(f"Background music volume set to {self.music_volume}")
     
     def set_sfx_volume(self, volume: float) -> None:
         """Set sound effects volume"""
         self.sfx_volume = max(0.0, min(1.0, volume))
+        self._sfx_gain = self.master_volume * self.sfx_volume
         logging.info(f"Sound effects volume set to {self.sfx_volume}")
     
     def toggle_music(self) -> None:
         """Toggle background music on or off"""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.pause()
+        if self.music_playing:
+            self._pause_music()
             logging.info("Background music paused")
         else:
-            pygame.mixer.music.unpause()
+            self._unpause_music()
             logging.info("Background music resumed")
     
     def cleanup(self) -> None:
         """Clean up sound resources"""
         pygame.mixer.music.stop()
+        self.music_playing = False
         self._sound_cache.clear()
+        self._last_volume.clear()
         pygame.mixer.stop()
         self.logger.info("Sound system cleaned up")
 
@@ -825,16 +1054,44 @@ class SoundManager:
 # RENDERER CLASS
 ##########################
 
+# Sine lookup table for animation phases; visual wobble doesn't need math.sin precision
+_SIN_LUT_SIZE = 256
+_SIN_LUT = [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+
+def _sin(x: float) -> float:
+    """Approximate sin(x) for non-negative x via the lookup table"""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+
 class Renderer:
     """
     Handles all game rendering operations.
     Centralizes drawing logic and screen management.
     """
+    TEXT_CACHE_SIZE = 128
+    TEXT_SHADOW_PADDING = 2
+    TEXT_GLOW_PADDING = 3
+    FOOD_PULSE_STEPS = 16
+
     def __init__(self, config: GameConfig, resources: ResourceManager):
         self.config = config
         self.resources = resources
         self.x_offset = 0
         self.y_offset = 0
+        # Fully composited text (glow + shadows + text) keyed by its look
+        self._text_cache: OrderedDict = OrderedDict()
+        # Filled overlays keyed by (width, height, alpha)
+        self._overlay_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # Food sprites for each quantized pulse step, built for one cell size
+        self._food_sprites: List[pygame.Surface] = []
+        self._food_sprites_size: Optional[int] = None
+        # Snake segment sprites keyed by (radius, invincible, is_head)
+        self._snake_glow_cache: Dict[Tuple[int, bool, bool], pygame.Surface] = {}
+        self._snake_glow_cache_size: Optional[int] = None
+        # Rounded obstacle rectangles keyed by (size, color)
+        self._obstacle_sprites: Dict[Tuple[int, Tuple[int, ...]], pygame.Surface] = {}
         
     def update_offsets(self, window_width: int, window_height: int) -> None:
         """Calculate and update the top-left offset to center the grid"""
@@ -852,10 +1109,9 @@ class Renderer:
     def draw_background(self, surface: pygame.Surface,
                        width: int, height: int) -> None:
         """Draw background scaled to grid size and centered"""
-        background = self.resources.get_background()
-        if background:
-            bg_scaled = pygame.transform.scale(background, (self.config.GRID_COLS * self.config.cell_size,
-                                                           self.config.GRID_ROWS * self.config.cell_size))
+        bg_scaled = self.resources.get_background_scaled((self.config.GRID_COLS * self.config.cell_size,
+                                                          self.config.GRID_ROWS * self.config.cell_size))
+        if bg_scaled:
             surface.blit(bg_scaled, (self.x_offset, self.y_offset))
         else:
             # Fill the grid area with black
@@ -867,9 +1123,17 @@ class Renderer:
     def draw_overlay(self, surface: pygame.Surface,
                     width: int, height: int, alpha: int = 80) -> None:
         """Draw semi-transparent overlay"""
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, alpha))
+        key = (width, height, alpha)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            self._overlay_cache[key] = overlay
         surface.blit(overlay, (0, 0))
+
+    def invalidate_overlay_cache(self) -> None:
+        """Drop overlays built for a previous window size"""
+        self._overlay_cache.clear()
         
     def draw_text(self, surface: pygame.Surface, text: str,
                   x: int, y: int, size: int = 24,
@@ -882,274 +1146,351 @@ class Renderer:
             color = self.config.WHITE
         if shadow_color is None:
             shadow_color = self.config.BLACK
-            
-        font = self.resources.get_font(size)
-        
-        # Create shadow effect
-        shadow_offsets = [(2, 2), (2, -2), (-2, 2), (-2, -2)] if glow else [(2, 2)]
+
+        key = (text, size, tuple(color), tuple(shadow_color), glow)
+        composite = self._text_cache.get(key)
+        if composite is None:
+            composite = self._compose_text(text, size, color, shadow_color, glow)
+            self._store_text(key, composite)
+        else:
+            self._text_cache.move_to_end(key)
+
+        # The composite is padded evenly, so its center matches the text center
+        rect = composite.get_rect()
+        if center:
+            rect.center = (x, y)
+        else:
+            pad = self.TEXT_GLOW_PADDING if glow else self.TEXT_SHADOW_PADDING
+            rect.topleft = (x - pad, y - pad)
+        surface.blit(composite, rect)
+
+    def _compose_text(self, text: str, size: int, color: Tuple[int, ...],
+                      shadow_color: Tuple[int, ...], glow: bool) -> pygame.Surface:
+        """Render glow, shadows and text once onto a single transparent surface"""
+        rendered_text = self.resources.render_text(text, size, color)
+        pad = self.TEXT_GLOW_PADDING if glow else self.TEXT_SHADOW_PADDING
+        width, height = rendered_text.get_size()
+        composite = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
 
         # Handle glowing text effect
         if glow:
-            glow_surface = pygame.Surface((size * len(text), size), pygame.SRCALPHA)
             glow_color = (*color[:3], 128)
-            rendered_glow = font.render(text, True, glow_color)
+            rendered_glow = self.resources.render_text(text, size, glow_color)
             for offset in range(3, 0, -1):
-                glow_rect = rendered_glow.get_rect()
-                if center:
-                    glow_rect.center = (x + offset, y + offset)
-                else:
-                    glow_rect.topleft = (x + offset, y + offset)
-                glow_surface.blit(rendered_glow, glow_rect)
-            # Position glow_surface correctly
-            if center:
-                surface.blit(glow_surface, (x - size * len(text) // 2, y - size // 2))
-            else:
-                surface.blit(glow_surface, (x, y))
+                composite.blit(rendered_glow, (pad + offset, pad + offset))
 
         # Draw shadows
-        rendered_shadow = font.render(text, True, shadow_color)
+        shadow_offsets = [(2, 2), (2, -2), (-2, 2), (-2, -2)] if glow else [(2, 2)]
+        rendered_shadow = self.resources.render_text(text, size, shadow_color)
         for offset_x, offset_y in shadow_offsets:
-            shadow_rect = rendered_shadow.get_rect()
-            if center:
-                shadow_rect.center = (x + offset_x, y + offset_y)
-            else:
-                shadow_rect.topleft = (x + offset_x, y + offset_y)
-            surface.blit(rendered_shadow, shadow_rect)
+            composite.blit(rendered_shadow, (pad + offset_x, pad + offset_y))
 
         # Draw main text
-        rendered_text = font.render(text, True, color)
-        text_rect = rendered_text.get_rect()
-        if center:
-            text_rect.center = (x, y)
-        else:
-            text_rect.topleft = (x, y)
-        surface.blit(rendered_text, text_rect)
-    
+        composite.blit(rendered_text, (pad, pad))
+        return composite
+
+    def _store_text(self, key: tuple, composite: pygame.Surface) -> None:
+        """Insert a composited text surface, evicting the least recently used"""
+        self._text_cache[key] = composite
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+
     def draw_food(self, surface: pygame.Surface, x: int, y: int,
                   cell_size: int, frame_count: int) -> None:
         """Draw food with pulsing glow effect"""
+        if cell_size != self._food_sprites_size:
+            self._food_sprites = [
+                self._build_food_sprite(cell_size, 0.7 + 0.3 * i / (self.FOOD_PULSE_STEPS - 1))
+                for i in range(self.FOOD_PULSE_STEPS)
+            ]
+            self._food_sprites_size = cell_size
+
+        # Create pulsing effect, quantized to one of the prebuilt sprites
+        step = round(abs(_sin(frame_count * 0.1)) * (self.FOOD_PULSE_STEPS - 1))
+        sprite = self._food_sprites[step]
+
         screen_x, screen_y = self.grid_to_screen(x, y)
         center_x = screen_x + cell_size // 2
         center_y = screen_y + cell_size // 2
-        base_radius = max(cell_size // 2 - 2, 2)
+        half = sprite.get_width() // 2
+        surface.blit(sprite, (center_x - half, center_y - half))
 
-        # Create pulsing effect
-        pulse = abs(math.sin(frame_count * 0.1)) * 0.3 + 0.7
+    def _build_food_sprite(self, cell_size: int, pulse: float) -> pygame.Surface:
+        """Composite glow layers, core and highlight for one pulse value"""
+        base_radius = max(cell_size // 2 - 2, 2)
+        outer_radius = base_radius + 4
+        sprite = pygame.Surface((outer_radius * 2 + 2, outer_radius * 2 + 2), pygame.SRCALPHA)
+        center = outer_radius + 1
 
         # Draw outer glow layers
-        for radius in range(base_radius + 4, base_radius - 1, -1):
+        for radius in range(outer_radius, base_radius - 1, -1):
             alpha = int(100 * pulse * (radius - base_radius + 4) / 4)
             glow_color = (255, 0, 0, alpha)
             glow_surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
             pygame.draw.circle(glow_surface, glow_color,
                              (radius + 1, radius + 1), radius)
-            surface.blit(glow_surface,
-                        (center_x - radius - 1, center_y - radius - 1))
+            sprite.blit(glow_surface, (center - radius - 1, center - radius - 1))
 
         # Draw main food body
         core_color = (200, 0, 0)
-        pygame.draw.circle(surface, core_color,
-                         (center_x, center_y), base_radius)
+        pygame.draw.circle(sprite, core_color, (center, center), base_radius)
 
         # Add highlight for depth
-        highlight_pos = (center_x - base_radius // 3,
-                        center_y - base_radius // 3)
+        highlight_pos = (center - base_radius // 3, center - base_radius // 3)
         highlight_radius = max(base_radius // 3, 1)
-        pygame.draw.circle(surface, (255, 128, 128),
-                         highlight_pos, highlight_radius)
-    
+        pygame.draw.circle(sprite, (255, 128, 128), highlight_pos, highlight_radius)
+        return sprite
+
     def draw_obstacles(self, surface: pygame.Surface,
-                      obstacles: Set['Obstacle'],
+                      obstacles: 'ObstacleManager',
                       cell_size: int, frame_count: int) -> None:
-        """Draw obstacles with magical appearance"""
-        for obstacle in obstacles:
-            obstacle.draw(surface, self)
+        """Draw obstacles as rectangles with rounded corners"""
+        size = max(cell_size - 4, 1)  # Padding for visual appeal
+        key = (size, self.config.GRAY)
+        sprite = self._obstacle_sprites.get(key)
+        if sprite is None:
+            # All obstacles look alike, so rasterize the rounded rect once
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, self.config.GRAY, sprite.get_rect(), border_radius=8)
+            self._obstacle_sprites[key] = sprite
+        # Screen positions for all obstacles at once, then a single batched blit
+        xs = (obstacles.x * cell_size + (self.x_offset + 2)).tolist()
+        ys = (obstacles.y * cell_size + (self.y_offset + 2)).tolist()
+        surface.blits([(sprite, pos) for pos in zip(xs, ys)], doreturn=False)
     
     def draw_powerups(self, surface: pygame.Surface, powerup_manager: 'PowerUpManager',
                      cell_size: int, frame_count: int, particle_system: ParticleSystem) -> None:
         """Draw all active power-ups with enhanced visuals and animations"""
         powerup_manager.draw(surface, cell_size, frame_count, particle_system)
     
-    def draw_snake(self, surface: pygame.Surface, snake_body: List[Tuple[int, int]], frame_count: int, invincible: bool) -> None:
+    def draw_snake(self, surface: pygame.Surface, snake_body: Deque[Tuple[int, int]], frame_count: int, invincible: bool) -> None:
         """Draw snake with animated effects"""
+        cell_size = self.config.cell_size
+        if cell_size != self._snake_glow_cache_size:
+            self._snake_glow_cache.clear()
+            self._snake_glow_cache_size = cell_size
+
+        # Bind per-segment lookups to locals; this loop runs for every segment every frame
+        half_cell = cell_size // 2
+        origin_x = self.x_offset + half_cell
+        origin_y = self.y_offset + half_cell
+        head_r = half_cell - 2
+        body_r = max(half_cell - 4, 2)
+        phase0 = frame_count * 0.1
+        sprites = self._snake_glow_cache
+        blit_list = []
+
         for i, (sx, sy) in enumerate(snake_body):
-            screen_x, screen_y = self.grid_to_screen(sx, sy)
-            center_x = screen_x + self.config.cell_size // 2
-            center_y = screen_y + self.config.cell_size // 2
+            center_x = sx * cell_size + origin_x
+            center_y = sy * cell_size + origin_y
 
             # Calculate wave effect
-            phase = (frame_count * 0.1) + i * 0.3
-            wave = 2 * math.sin(phase)
+            wave = 2 * _sin(phase0 + i * 0.3)
+
+            is_head = i == 0
+            radius = max((head_r if is_head else body_r) + int(wave), 2)
+
+            key = (radius, invincible, is_head)
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = self._build_snake_sprite(radius, invincible, is_head)
+                sprites[key] = sprite
+            half = sprite.get_width() // 2
+            blit_list.append((sprite, (center_x - half, center_y - half)))
+        surface.blits(blit_list, doreturn=False)
+
+    def _build_snake_sprite(self, radius: int, invincible: bool,
+                            is_head: bool) -> pygame.Surface:
+        """Composite glow, outline and fill (plus eyes for the head) for one segment"""
+        glow_pad = 4 if is_head else 2
+        center = radius + glow_pad
+        sprite = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+
+        # Add glow effect
+        if is_head:
+            glow_color = (0, 255, 0, 100) if not invincible else (0, 255, 255, 150)
+        else:
+            glow_color = (0, 200, 0, 80) if not invincible else (0, 200, 200, 120)
+        glow_surface = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow_surface, glow_color, (center, center), center)
+        sprite.blit(glow_surface, (0, 0))
+
+        pygame.draw.circle(sprite, self.config.BLACK, (center, center), radius + 2)
+        fill_color = self.config.GREEN if not invincible else self.config.CYAN
+        pygame.draw.circle(sprite, fill_color, (center, center), radius)
+
+        if is_head:
+            # Draw eyes with glow
+            eye_offset = radius // 2
+            eye_pos1 = (center - eye_offset // 2, center - eye_offset)
+            eye_pos2 = (center + eye_offset // 2, center - eye_offset)
+            eye_r = eye_offset // 3
+
+            # Eye glow
+            eye_glow_color = (*self.config.WHITE[:3], 128)
+            eye_glow_surface = pygame.Surface((eye_r * 2 + 4, eye_r * 2 + 4), pygame.SRCALPHA)
+            pygame.draw.circle(eye_glow_surface, eye_glow_color,
+                             (eye_r + 2, eye_r + 2), eye_r + 2)
+            sprite.blit(eye_glow_surface, (eye_pos1[0] - eye_r - 2, eye_pos1[1] - eye_r - 2))
+            sprite.blit(eye_glow_surface, (eye_pos2[0] - eye_r - 2, eye_pos2[1] - eye_r - 2))
+
+            # Eyes
+            pygame.draw.circle(sprite, self.config.WHITE, eye_pos1, eye_r)
+            pygame.draw.circle(sprite, self.config.WHITE, eye_pos2, eye_r)
+        return sprite
 
-            if i == 0:  # Head
-                base_r = self.config.cell_size // 2 - 2
-                radius = max(base_r + int(wave), 2)
-                
-                # Add glow effect to head
-                glow_color = (0, 255, 0, 100) if not invincible else (0, 255, 255, 150)
-                glow_surface = pygame.Surface((radius * 2 + 8, radius * 2 + 8), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, glow_color,
-                                 (radius + 4, radius + 4), radius + 4)
-                surface.blit(glow_surface, (center_x - radius - 4, center_y - radius - 4))
-                
-                pygame.draw.circle(surface, self.config.BLACK,
-                                 (center_x, center_y), radius + 2)
-                head_color = self.config.GREEN if not invincible else self.config.CYAN
-                pygame.draw.circle(surface, head_color,
-                                 (center_x, center_y), radius)
-                
-                # Draw eyes with glow
-                eye_offset = radius // 2
-                eye_pos1 = (center_x - eye_offset // 2,
-                           center_y - eye_offset)
-                eye_pos2 = (center_x + eye_offset // 2,
-                           center_y - eye_offset)
-                eye_r = eye_offset // 3
-                
-                # Eye glow
-                eye_glow_color = (*self.config.WHITE[:3], 128)
-                eye_glow_surface = pygame.Surface((eye_r * 2 + 4, eye_r * 2 + 4), pygame.SRCALPHA)
-                pygame.draw.circle(eye_glow_surface, eye_glow_color,
-                                 (eye_r + 2, eye_r + 2), eye_r + 2)
-                surface.blit(eye_glow_surface, (eye_pos1[0] - eye_r - 2, eye_pos1[1] - eye_r - 2))
-                surface.blit(eye_glow_surface, (eye_pos2[0] - eye_r - 2, eye_pos2[1] - eye_r - 2))
-                
-                # Eyes
-                pygame.draw.circle(surface, self.config.WHITE,
-                                 eye_pos1, eye_r)
-                pygame.draw.circle(surface, self.config.WHITE,
-                                 eye_pos2, eye_r)
-            else:  # Body
-                base_r = max(self.config.cell_size // 2 - 4, 2)
-                radius = max(base_r + int(wave), 2)
-                
-                # Add glow effect to body segments
-                glow_color = (0, 200, 0, 80) if not invincible else (0, 200, 200, 120)
-                glow_surface = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, glow_color,
-                                 (radius + 2, radius + 2), radius + 2)
-                surface.blit(glow_surface, (center_x - radius - 2, center_y - radius - 2))
+
+##########################
+# SNAKE CLASS
+##########################
+
+class Snake:
+    """
+    Represents the snake entity with its movement logic and collision detection.
+    Handles snake movement, growth, and collision checking.
+    Implements conditional wrap-around movement based on invincibility.
+    """
+    MAX_QUEUED_TURNS = 2  # One turn is applied per tick
+
+    def __init__(self, config: GameConfig):
+        self.config = config
+        self.body: Deque[Tuple[int, int]] = deque([(15, 10), (14, 10), (13, 10)])
+        # Mirror of body for O(1) membership tests: cell -> number of segments
+        # on it (segments can overlap while invincible)
+        self.body_cells: Dict[Tuple[int, int], int] = {}
+        for segment in self.body:
+            self._occupy(segment)
+        self.direction = Direction.RIGHT
+        # Turns waiting for upcoming ticks, so quick successive presses aren't lost
+        self.direction_queue: Deque[Direction] = deque()
+        self.invincible = False  # Attribute for invincibility
+
+    def set_direction(self, new_direction: Direction) -> None:
+        """
+        Queue a turn for the next tick.
+        Repeats and 180-degree turns relative to the last queued direction are ignored.
+        """
+        last = self.direction_queue[-1] if self.direction_queue else self.direction
+        if (len(self.direction_queue) < self.MAX_QUEUED_TURNS
+                and new_direction != last and new_direction != last.opposite):
+            self.direction_queue.append(new_direction)
                 
-                pygame.draw.circle(surface, self.config.BLACK,
-                                 (center_x, center_y), radius + 2)
-                seg_color = self.config.GREEN if not invincible else self.config.CYAN
-                pygame.draw.circle(surface, seg_color,
-                                 (center_x, center_y), radius)
-    
-    ##########################
-    # SNAKE CLASS
-    ##########################
-    
-    class Snake:
+    def move(self, food_pos: Tuple[int, int],
+             obstacles: FrozenSet[Tuple[int, int]]) -> bool:
         """
-        Represents the snake entity with its movement logic and collision detection.
-        Handles snake movement, growth, and collision checking.
-        Implements conditional wrap-around movement based on invincibility.
+        Move snake and check for collisions.
+        Returns False if move results in death.
+        Implements conditional wrap-around based on invincibility.
         """
-        def __init__(self, config: GameConfig):
-            self.config = config
-            self.body: List[Tuple[int, int]] = [(15, 10), (14, 10), (13, 10)]
-            self.direction = Direction.RIGHT
-            self.next_direction = Direction.RIGHT
-            self.invincible = False  # Attribute for invincibility
-    
-        def set_direction(self, new_direction: Direction) -> None:
-            """Update direction ensuring no 180-degree turns"""
-            if new_direction != self.direction.opposite:
-                self.next_direction = new_direction
-                    
-        def move(self, food_pos: Tuple[int, int],
-                 obstacles: Set[Tuple[int, int]]) -> bool:
-            """
-            Move snake and check for collisions.
-            Returns False if move results in death.
-            Implements conditional wrap-around based on invincibility.
-            """
-            self.direction = self.next_direction
-            head_x, head_y = self.body[0]
-            
-            # Calculate new head position based on direction
-            if self.direction == Direction.UP:
-                head_y -= 1
-            elif self.direction == Direction.DOWN:
-                head_y += 1
-            elif self.direction == Direction.LEFT:
-                head_x -= 1
-            elif self.direction == Direction.RIGHT:
-                head_x += 1
-            
-            # Handle wall collision
+        if self.direction_queue:
+            self.direction = self.direction_queue.popleft()
+        head_x, head_y = self.body[0]
+        
+        # Calculate new head position based on direction
+        dx, dy = _DIRECTION_DELTAS[self.direction]
+        head_x += dx
+        head_y += dy
+        
+        # Handle wall collision
+        if not self.invincible:
+            # If out of bounds, die
+            if head_x < 0 or head_x >= self.config.GRID_COLS or head_y < 0 or head_y >= self.config.GRID_ROWS:
+                return False
+        else:
+            # If invincible, wrap around
+            head_x %= self.config.GRID_COLS
+            head_y %= self.config.GRID_ROWS
+        
+        new_head = (head_x, head_y)
+        
+        # Check collision with self or obstacles (before the head is added)
+        if new_head in self.body_cells or new_head in obstacles:
             if not self.invincible:
-                # If out of bounds, die
-                if head_x < 0 or head_x >= self.config.GRID_COLS or head_y < 0 or head_y >= self.config.GRID_ROWS:
-                    return False
-            else:
-                # If invincible, wrap around
-                head_x %= self.config.GRID_COLS
-                head_y %= self.config.GRID_ROWS
-            
-            new_head = (head_x, head_y)
-            self.body.insert(0, new_head)
-            
-            # Check collision with self or obstacles
-            if new_head in self.body[1:] or new_head in obstacles:
-                if not self.invincible:
-                    return False
-                    
-            # Remove tail if no food eaten
-            if new_head != food_pos:
-                self.body.pop()
+                return False
+
+        self.body.appendleft(new_head)
+        self._occupy(new_head)
                 
-            return True
+        # Remove tail if no food eaten
+        if new_head != food_pos:
+            self._vacate(self.body.pop())
+            
+        return True
+
+    def shrink(self, segments: int) -> None:
+        """Remove segments from the tail of the snake"""
+        for _ in range(segments):
+            self._vacate(self.body.pop())
+
+    def _occupy(self, cell: Tuple[int, int]) -> None:
+        """Record a body segment on the given cell"""
+        self.body_cells[cell] = self.body_cells.get(cell, 0) + 1
+
+    def _vacate(self, cell: Tuple[int, int]) -> None:
+        """Remove a body segment from the given cell"""
+        count = self.body_cells[cell] - 1
+        if count:
+            self.body_cells[cell] = count
+        else:
+            del self.body_cells[cell]
+
+    def head_position(self) -> Tuple[int, int]:
+        """Returns the current head position of the snake"""
+        return self.body[0]
     
-        def head_position(self) -> Tuple[int, int]:
-            """Returns the current head position of the snake"""
-            return self.body[0]
-        
-        # Removed the empty draw method as rendering is handled by Renderer.draw_snake
+    # Removed the empty draw method as rendering is handled by Renderer.draw_snake
 
 
 ##########################
-# OBSTACLE CLASS
+# OBSTACLE MANAGER CLASS
 ##########################
 
-class Obstacle:
+class ObstacleManager:
     """
-    Represents an obstacle in the game.
-    Handles movement and rendering with enhanced collision detection.
+    Holds all moving obstacles as parallel NumPy arrays.
+    Every obstacle advances one cell per tick and wraps around the grid,
+    so the whole set is stepped with a few array operations.
     """
-    def __init__(self, x: int, y: int, direction: Direction, config: GameConfig):
-        self.x = x
-        self.y = y
-        self.direction = direction
+    # Per-direction steps, indexed by position in Direction (UP, DOWN, LEFT, RIGHT)
+    _DIRECTIONS = list(Direction)
+    _DX = np.array([_DIRECTION_DELTAS[d][0] for d in _DIRECTIONS], dtype=np.int32)
+    _DY = np.array([_DIRECTION_DELTAS[d][1] for d in _DIRECTIONS], dtype=np.int32)
+
+    def __init__(self, config: GameConfig):
         self.config = config
-        self.color = self.config.GRAY
-        self.size = self.config.cell_size - 4  # Padding for visual appeal
-    
-    def move(self):
-        """Move obstacle based on its direction"""
-        if self.direction == Direction.UP:
-            self.y -= 1
-        elif self.direction == Direction.DOWN:
-            self.y += 1
-        elif self.direction == Direction.LEFT:
-            self.x -= 1
-        elif self.direction == Direction.RIGHT:
-            self.x += 1
-        
-        # Wrap around the grid
+        self.x = np.empty(0, dtype=np.int32)
+        self.y = np.empty(0, dtype=np.int32)
+        self.direction = np.empty(0, dtype=np.int8)
+        # Occupied cells, rebuilt after each move for O(1) collision checks.
+        # Frozen so callers can share it without copying or mutating it
+        self.positions: FrozenSet[Tuple[int, int]] = frozenset()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def reset(self, cells: List[Tuple[int, int]], directions: List[Direction]) -> None:
+        """Replace all obstacles with the given cells and headings"""
+        self.x = np.array([x for x, _ in cells], dtype=np.int32)
+        self.y = np.array([y for _, y in cells], dtype=np.int32)
+        self.direction = np.array([self._DIRECTIONS.index(d) for d in directions], dtype=np.int8)
+        self._update_positions()
+
+    def clear(self) -> None:
+        """Remove all obstacles"""
+        self.reset([], [])
+
+    def move(self) -> None:
+        """Move every obstacle one cell along its direction, wrapping around the grid"""
+        if not len(self.x):
+            return
+        self.x += self._DX[self.direction]
         self.x %= self.config.GRID_COLS
+        self.y += self._DY[self.direction]
         self.y %= self.config.GRID_ROWS
-    
-    def get_rect(self) -> pygame.Rect:
-        """Get obstacle rectangle"""
-        return pygame.Rect(self.x * self.config.cell_size + 2, self.y * self.config.cell_size + 2, self.size, self.size)
-    
-    def draw(self, surface: pygame.Surface, renderer: Renderer):
-        """Draw obstacle as a rectangle with rounded corners"""
-        screen_x, screen_y = renderer.grid_to_screen(self.x, self.y)
-        rect = pygame.Rect(screen_x + 2, screen_y + 2, self.size, self.size)
-        pygame.draw.rect(surface, self.color, rect, border_radius=8)
+        self._update_positions()
+
+    def _update_positions(self) -> None:
+        self.positions = frozenset(zip(self.x.tolist(), self.y.tolist()))
 
 
 ##########################
@@ -1177,6 +1518,8 @@ class Settings:
             'SUBMIT': pygame.K_RETURN,
             'VIEW_HIGHSCORES': pygame.K_h
         }
+        self._dirty = False  # Unsaved changes, written by flush()
+        self.version = 0  # Bumped whenever key bindings change
         self.load_settings()
     
     def load_settings(self) -> None:
@@ -1187,6 +1530,7 @@ class Settings:
                 with open(settings_path, 'r') as f:
                     data = json.load(f)
                 self.key_bindings = data.get("key_bindings", self.key_bindings)
+                self.version += 1
                 logging.info("Settings loaded successfully.")
             except Exception as e:
                 logging.error(f"Error loading settings: {e}")
@@ -1200,6 +1544,7 @@ class Settings:
         try:
             with open(settings_path, 'w') as f:
                 json.dump({"key_bindings": self.key_bindings}, f, indent=4)
+            self._dirty = False
             logging.info("Settings saved successfully.")
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
@@ -1208,19 +1553,58 @@ class Settings:
         """Set a new key binding for a specific action"""
         if action in self.key_bindings:
             self.key_bindings[action] = key
-            self.save_settings()
+            self._dirty = True  # Saved on flush() so several rebinds cost one write
+            self.version += 1
             logging.info(f"Key binding for {action} set to {pygame.key.name(key)}")
+
+    def flush(self) -> None:
+        """Write settings to disk if they changed since the last save"""
+        if self._dirty:
+            self.save_settings()
     
     def get_key(self, action: str) -> int:
         """Get the key binding for a specific action"""
         return self.key_bindings.get(action, pygame.K_ESCAPE)
 
+    def keymap(self, actions: Tuple[str, ...]) -> Dict[int, str]:
+        """
+        Build a key -> action lookup for the given actions.
+        When several actions share a key, the earlier one in actions wins.
+        """
+        keymap: Dict[int, str] = {}
+        for action in actions:
+            keymap.setdefault(self.get_key(action), action)
+        return keymap
+
 
 ##########################
 # MAIN GAME CLASS
 ##########################
 
 class Game:
+    # Screens with no animation; they only need redrawing when something happens
+    STATIC_STATES = frozenset({GameState.MENU, GameState.SETTINGS,
+                               GameState.HIGHSCORES, GameState.GAME_OVER})
+    MAX_FRAME_TIME = 0.25  # Seconds of game time a single frame may advance
+    # Actions handled per state, in precedence order for shared keys
+    MENU_ACTIONS = ('PLAY', 'HIGHSCORES', 'TOGGLE_OBSTACLES', 'OPTIONS', 'QUIT')
+    GAME_ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT', 'PAUSE', 'QUIT')
+    # Audio controls on the settings screen aren't rebindable; they take
+    # precedence over a QUIT binding on the same key
+    SETTINGS_KEYS = {
+        pygame.K_m: 'TOGGLE_MUSIC',
+        pygame.K_UP: 'MUSIC_UP',
+        pygame.K_DOWN: 'MUSIC_DOWN',
+        pygame.K_u: 'SFX_UP',
+        pygame.K_j: 'SFX_DOWN'
+    }
+    _ACTION_DIRECTIONS = {
+        'UP': Direction.UP,
+        'DOWN': Direction.DOWN,
+        'LEFT': Direction.LEFT,
+        'RIGHT': Direction.RIGHT
+    }
+
     def __init__(self):
         """Initialize the game and all its components"""
         # Initialize Pygame modules
@@ -1233,6 +1617,7 @@ class Game:
         # Initialize configurations and managers
         self.config = GameConfig()
         self.resources = ResourceManager(self.config)
+        self.resources.preload_fonts(self.config.FONT_SIZES)
         self.settings = Settings(self.config, self.resources)  # Passed ResourceManager to Settings
         self.score_manager = ScoreManager(self.config, self.resources)
         self.particles = ParticleSystem(self.config)
@@ -1253,6 +1638,10 @@ class Game:
         # Initialize Pygame window with default size 800x600
         self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
         pygame.display.set_caption("Metal Snake - Reign of the Digital Serpent")
+        # Only queue events the game handles; SDL drops the rest (e.g. mouse motion)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.VIDEORESIZE,
+                                  pygame.VIDEOEXPOSE, pygame.KEYDOWN])
 
         self.clock = pygame.time.Clock()
         self.state = GameState.MENU
@@ -1263,19 +1652,33 @@ class Game:
         self.snake: Optional[Snake] = None
         self.score = 0
         self.game_tick = 0
+        self._frame_dt = 0.0  # Seconds since the previous frame
+        self._tick_accumulator = 0.0  # Game time not yet consumed by logic ticks
         self.food_pos: Optional[Tuple[int, int]] = None
-        self.obstacles: Set[Obstacle] = set()
+        self.obstacles = ObstacleManager(self.config)
         self.score_multiplier = 1  # For score multiplier power-up
         self.active_powerups: Dict[PowerUpType, int] = {}
         self.magnet_active: bool = False  # Tracks if magnet is active
         self.cell_size = 0  # Will be set in run()
         self.settings_menu_active = False
-
-        # Set initial offsets
-        window_width, window_height = self.screen.get_size()
-        self.cell_size = min(window_width // self.config.GRID_COLS, window_height // self.config.GRID_ROWS)
-        self.config.cell_size = self.cell_size
-        self.renderer.update_offsets(window_width, window_height)
+        self._drawn_state: Optional[GameState] = None  # State shown on the last presented frame
+        # Menu labels embedding key names, rebuilt when key bindings change
+        self._menu_labels: Dict[str, str] = {}
+        self._menu_labels_version = -1
+        # Reverse key lookups per state, rebuilt when key bindings change
+        self._menu_keymap: Dict[int, str] = {}
+        self._game_keymap: Dict[int, str] = {}
+        self._settings_keymap: Dict[int, str] = {}
+        self._keymaps_version = -1
+        # Formatted high score lines per mode, rebuilt when the scores change
+        self._highscore_lines: Dict[str, List[str]] = {}
+        self._highscore_lines_version = -1
+        # Audio status lines on the settings screen, keyed by the values they show
+        self._audio_status_lines: List[str] = []
+        self._audio_status_key: Optional[Tuple[bool, float, float]] = None
+
+        # Set initial window size, cell size and offsets
+        self.handle_resize(*self.screen.get_size())
 
         self.reset_game()
 
@@ -1284,14 +1687,13 @@ class Game:
         self.snake = Snake(self.config)
         self.score = 0
         self.game_tick = 0
+        self._tick_accumulator = 0.0
         self.food_pos = self.get_random_position()
-        self.obstacles = set()
+        self.obstacles.clear()
         if self.obstacles_enabled:
-            self.obstacles = self.generate_obstacles()
-        self.particles.particles.clear()
-        self.particles.particle_pool.clear()
-        self.powerup_manager.powerups.clear()
-        self.powerup_manager.active_powerups.clear()
+            self.generate_obstacles()
+        self.particles.clear()
+        self.powerup_manager.clear()
         self.score_multiplier = 1
         self.config.GAME_SPEED = self.config.BASE_GAME_SPEED  # Reset game speed
         self.snake.invincible = False  # Reset invincibility
@@ -1301,44 +1703,57 @@ class Game:
 
     def get_random_position(self, include_powerups: bool = False) -> Tuple[int, int]:
         """Get random grid position avoiding snake, obstacles, and existing power-ups"""
+        # Occupancy doesn't change while searching, so gather it once
+        body_cells = self.snake.body_cells
+        obstacle_positions = self.obstacles.positions
+        powerup_positions = self.powerup_manager.powerup_by_pos if include_powerups else {}
+
+        if self.powerup_manager.magnet_active:
+            # Place food closer to the snake's head
+            head_x, head_y = self.snake.head_position()
+            # Define a range within which to spawn food
+            range_x = max(head_x - 5, 0), min(head_x + 5, self.config.GRID_COLS - 1)
+            range_y = max(head_y - 5, 0), min(head_y + 5, self.config.GRID_ROWS - 1)
+        else:
+            range_x = 0, self.config.GRID_COLS - 1
+            range_y = 0, self.config.GRID_ROWS - 1
+
         while True:
-            if self.powerup_manager.magnet_active:
-                # Place food closer to the snake's head
-                head_x, head_y = self.snake.head_position()
-                # Define a range within which to spawn food
-                range_x = max(head_x - 5, 0), min(head_x + 5, self.config.GRID_COLS - 1)
-                range_y = max(head_y - 5, 0), min(head_y + 5, self.config.GRID_ROWS - 1)
-                x = random.randint(*range_x)
-                y = random.randint(*range_y)
-            else:
-                x = random.randint(0, self.config.GRID_COLS - 1)
-                y = random.randint(0, self.config.GRID_ROWS - 1)
-            pos = (x, y)
-            if (pos not in self.snake.body and
-                pos not in { (ob.x, ob.y) for ob in self.obstacles } and
-                (not include_powerups or pos not in [pu.position() for pu in self.powerup_manager.powerups ])):
+            pos = (random.randint(*range_x), random.randint(*range_y))
+            if (pos not in body_cells and
+                pos not in obstacle_positions and
+                pos not in powerup_positions):
                 return pos
 
-    def generate_obstacles(self) -> Set[Obstacle]:
+    def generate_obstacles(self) -> None:
         """Generate moving obstacles with random directions"""
-        obstacles = set()
-        for _ in range(self.config.OBSTACLE_COUNT):
-            pos = self.get_random_position()
-            direction = random.choice(list(Direction))
-            obstacle = Obstacle(pos[0], pos[1], direction, self.config)
-            obstacles.add(obstacle)
-        logging.info(f"Generated {len(obstacles)} moving obstacles.")
-        return obstacles
+        cells = [self.get_random_position() for _ in range(self.config.OBSTACLE_COUNT)]
+        directions = random.choices(tuple(Direction), k=self.config.OBSTACLE_COUNT)
+        self.obstacles.reset(cells, directions)
+        logging.info(f"Generated {len(self.obstacles)} moving obstacles.")
+
+    def handle_resize(self, width: int, height: int) -> None:
+        """Cache the window size and recompute everything derived from it"""
+        self._screen_w, self._screen_h = width, height
+        # Recalculate cell size based on new window size
+        self.cell_size = min(width // self.config.GRID_COLS, height // self.config.GRID_ROWS)
+        self.config.cell_size = self.cell_size
+        self.renderer.update_offsets(width, height)  # Update renderer offsets
+        self.resources.flush_scaled_background()
+        self.renderer.invalidate_overlay_cache()
 
     def run(self) -> None:
         """Main game loop with state machine architecture"""
         while True:
-            self.clock.tick(self.config.FPS)
+            self._frame_dt = self.clock.tick(self.config.FPS) / 1000.0
             self.frame_count += 1
 
             events = pygame.event.get()
+            key_events = []
             for event in events:
-                if event.type == pygame.QUIT:
+                if event.type == pygame.KEYDOWN:
+                    key_events.append(event)
+                elif event.type == pygame.QUIT:
                     self.cleanup()
                     return
                 elif event.type == pygame.VIDEORESIZE:
@@ -1346,105 +1761,134 @@ class Game:
                         (event.w, event.h),
                         pygame.RESIZABLE
                     )
-                    # Recalculate cell size based on new window size
-                    self.cell_size = min(event.w // self.config.GRID_COLS, event.h // self.config.GRID_ROWS)
-                    self.config.cell_size = self.cell_size
+                    self.handle_resize(event.w, event.h)
                     logging.info(f"Window resized to {event.w}x{event.h}. Cell size set to {self.cell_size}.")
-                    self.renderer.update_offsets(event.w, event.h)  # Update renderer offsets
 
-            # State machine update
+            # Idle static screens keep the last presented frame
+            if (self.state in self.STATIC_STATES and not events
+                    and self.state == self._drawn_state):
+                continue
+
+            # State machine update; handlers may switch state after drawing
+            drawn_state = self.state
             if self.state == GameState.MENU:
-                self.update_menu(events)
+                self.update_menu(key_events)
             elif self.state == GameState.PLAY:
-                self.update_game(events)
+                self.update_game(key_events)
             elif self.state == GameState.GAME_OVER:
-                self.update_game_over(events)
+                self.update_game_over(key_events)
             elif self.state == GameState.HIGHSCORES:
-                self.update_highscores(events)
+                self.update_highscores(key_events)
             elif self.state == GameState.SETTINGS:
-                self.update_settings(events)
+                self.update_settings(key_events)
 
             pygame.display.flip()
+            self._drawn_state = drawn_state
+
+    def refresh_menu_labels(self) -> None:
+        """Rebuild menu labels if key bindings changed since they were last built"""
+        if self.settings.version == self._menu_labels_version:
+            return
+
+        def key_label(action: str) -> str:
+            return f"[{pygame.key.name(self.settings.get_key(action)).upper()}]"
+
+        self._menu_labels = {
+            'play': f"{key_label('PLAY')} Play Game",
+            'highscores': f"{key_label('HIGHSCORES')} Highscores",
+            'obstacles_on': f"{key_label('TOGGLE_OBSTACLES')} Obstacles: ON",
+            'obstacles_off': f"{key_label('TOGGLE_OBSTACLES')} Obstacles: OFF",
+            'options': f"{key_label('OPTIONS')} Settings",
+            'quit': f"{key_label('QUIT')} Quit",
+            'return': f"{key_label('QUIT')} Return to Menu",
+        }
+        self._menu_labels_version = self.settings.version
 
-    def update_menu(self, events: List[pygame.event.Event]) -> None:
+    def refresh_keymaps(self) -> None:
+        """Rebuild the per-state key lookups if key bindings changed"""
+        if self.settings.version == self._keymaps_version:
+            return
+        self._menu_keymap = self.settings.keymap(self.MENU_ACTIONS)
+        self._game_keymap = self.settings.keymap(self.GAME_ACTIONS)
+        self._settings_keymap = {**self.settings.keymap(('QUIT',)), **self.SETTINGS_KEYS}
+        self._keymaps_version = self.settings.version
+
+    def update_menu(self, key_events: List[pygame.event.Event]) -> None:
         """Handle menu state updates and rendering"""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == self.settings.get_key('PLAY'):
-                    self.state = GameState.PLAY
-                    self.reset_game()
-                    self.sound_manager.play_menu_sound('select')
-                elif event.key == self.settings.get_key('HIGHSCORES'):
-                    self.state = GameState.HIGHSCORES
-                    self.sound_manager.play_menu_sound('select')
-                elif event.key == self.settings.get_key('TOGGLE_OBSTACLES'):
-                    self.obstacles_enabled = not self.obstacles_enabled
-                    logging.info(f"Obstacles toggled to {'ON' if self.obstacles_enabled else 'OFF'}.")
-                    self.sound_manager.play_menu_sound('move')
-                elif event.key == self.settings.get_key('OPTIONS'):
-                    self.state = GameState.SETTINGS
-                    self.sound_manager.play_menu_sound('select')
-                elif event.key == self.settings.get_key('QUIT'):
-                    self.cleanup()
-                    sys.exit()
+        self.refresh_menu_labels()
+        self.refresh_keymaps()
+        for event in key_events:
+            action = self._menu_keymap.get(event.key)
+            if action == 'PLAY':
+                self.state = GameState.PLAY
+                self.reset_game()
+                self.sound_manager.play_menu_sound('select')
+            elif action == 'HIGHSCORES':
+                self.state = GameState.HIGHSCORES
+                self.sound_manager.play_menu_sound('select')
+            elif action == 'TOGGLE_OBSTACLES':
+                self.obstacles_enabled = not self.obstacles_enabled
+                logging.info(f"Obstacles toggled to {'ON' if self.obstacles_enabled else 'OFF'}.")
+                self.sound_manager.play_menu_sound('move')
+            elif action == 'OPTIONS':
+                self.state = GameState.SETTINGS
+                self.sound_manager.play_menu_sound('select')
+            elif action == 'QUIT':
+                self.cleanup()
+                sys.exit()
 
         # Draw menu
-        w, h = self.screen.get_size()
-        if self.cell_size == 0:
-            self.cell_size = min(w // self.config.GRID_COLS, h // self.config.GRID_ROWS)
-            self.config.cell_size = self.cell_size
-            self.renderer.update_offsets(w, h)
+        w, h = self._screen_w, self._screen_h
         self.renderer.draw_background(self.screen, w, h)
         self.renderer.draw_overlay(self.screen, w, h)
 
         self.renderer.draw_text(self.screen, "METAL SNAKE",
                               w//2, h//2 - 100, size=48,
                               center=True, glow=True)
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('PLAY')).upper()}] Play Game",
+        self.renderer.draw_text(self.screen, self._menu_labels['play'],
                               w//2, h//2 - 40, size=30, center=True)
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('HIGHSCORES')).upper()}] Highscores",
+        self.renderer.draw_text(self.screen, self._menu_labels['highscores'],
                               w//2, h//2, size=30, center=True)
         self.renderer.draw_text(self.screen,
-                              f"[{pygame.key.name(self.settings.get_key('TOGGLE_OBSTACLES')).upper()}] Obstacles: {'ON' if self.obstacles_enabled else 'OFF'}",
+                              self._menu_labels['obstacles_on' if self.obstacles_enabled else 'obstacles_off'],
                               w//2, h//2 + 40, size=30, center=True)
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('OPTIONS')).upper()}] Settings",
+        self.renderer.draw_text(self.screen, self._menu_labels['options'],
                               w//2, h//2 + 80, size=30, center=True)
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('QUIT')).upper()}] Quit",
+        self.renderer.draw_text(self.screen, self._menu_labels['quit'],
                               w//2, h//2 + 120, size=30, center=True)
 
-    def update_settings(self, events: List[pygame.event.Event]) -> None:
+    def update_settings(self, key_events: List[pygame.event.Event]) -> None:
         """Handle settings state updates and rendering"""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_m:
-                    # Toggle background music
-                    self.sound_manager.toggle_music()
-                elif event.key == pygame.K_UP:
-                    # Increase music volume
-                    new_volume = min(1.0, self.sound_manager.music_volume + 0.1)
-                    self.sound_manager.set_music_volume(new_volume)
-                elif event.key == pygame.K_DOWN:
-                    # Decrease music volume
-                    new_volume = max(0.0, self.sound_manager.music_volume - 0.1)
-                    self.sound_manager.set_music_volume(new_volume)
-                elif event.key == pygame.K_u:
-                    # Increase sound effects volume
-                    new_sfx_volume = min(1.0, self.sound_manager.sfx_volume + 0.1)
-                    self.sound_manager.set_sfx_volume(new_sfx_volume)
-                elif event.key == pygame.K_j:
-                    # Decrease sound effects volume
-                    new_sfx_volume = max(0.0, self.sound_manager.sfx_volume - 0.1)
-                    self.sound_manager.set_sfx_volume(new_sfx_volume)
-                elif event.key == self.settings.get_key('QUIT'):
-                    self.state = GameState.MENU
-                    self.sound_manager.play_menu_sound('select')
+        self.refresh_menu_labels()
+        self.refresh_keymaps()
+        for event in key_events:
+            action = self._settings_keymap.get(event.key)
+            if action == 'TOGGLE_MUSIC':
+                # Toggle background music
+                self.sound_manager.toggle_music()
+            elif action == 'MUSIC_UP':
+                # Increase music volume
+                new_volume = min(1.0, self.sound_manager.music_volume + 0.1)
+                self.sound_manager.set_music_volume(new_volume)
+            elif action == 'MUSIC_DOWN':
+                # Decrease music volume
+                new_volume = max(0.0, self.sound_manager.music_volume - 0.1)
+                self.sound_manager.set_music_volume(new_volume)
+            elif action == 'SFX_UP':
+                # Increase sound effects volume
+                new_sfx_volume = min(1.0, self.sound_manager.sfx_volume + 0.1)
+                self.sound_manager.set_sfx_volume(new_sfx_volume)
+            elif action == 'SFX_DOWN':
+                # Decrease sound effects volume
+                new_sfx_volume = max(0.0, self.sound_manager.sfx_volume - 0.1)
+                self.sound_manager.set_sfx_volume(new_sfx_volume)
+            elif action == 'QUIT':
+                self.settings.flush()
+                self.state = GameState.MENU
+                self.sound_manager.play_menu_sound('select')
 
         # Draw settings menu
-        w, h = self.screen.get_size()
-        if self.cell_size == 0:
-            self.cell_size = min(w // self.config.GRID_COLS, h // self.config.GRID_ROWS)
-            self.config.cell_size = self.cell_size
-            self.renderer.update_offsets(w, h)
+        w, h = self._screen_w, self._screen_h
         self.renderer.draw_background(self.screen, w, h)
         self.renderer.draw_overlay(self.screen, w, h, alpha=80)
 
@@ -1457,79 +1901,47 @@ class Game:
                               w//2, 190, size=24, center=True)
         self.renderer.draw_text(self.screen, "[U] Volume Up | [J] Volume Down (SFX)",
                               w//2, 230, size=24, center=True)
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('QUIT')).upper()}] Return to Menu",
+        self.renderer.draw_text(self.screen, self._menu_labels['return'],
                               w//2, 270, size=30, center=True)
-        self.renderer.draw_text(self.screen, f"Music: {'On' if pygame.mixer.music.get_busy() else 'Off'}",
-                              w//2, 310, size=24, center=True)
-        self.renderer.draw_text(self.screen, f"Music Volume: {int(self.sound_manager.music_volume * 100)}%",
-                              w//2, 350, size=24, center=True)
-        self.renderer.draw_text(self.screen, f"SFX Volume: {int(self.sound_manager.sfx_volume * 100)}%",
-                              w//2, 390, size=24, center=True)
-
-    def update_game(self, events: List[pygame.event.Event]) -> None:
+        audio_key = (self.sound_manager.music_playing,
+                     self.sound_manager.music_volume,
+                     self.sound_manager.sfx_volume)
+        if audio_key != self._audio_status_key:
+            music_playing, music_volume, sfx_volume = audio_key
+            self._audio_status_lines = [
+                f"Music: {'On' if music_playing else 'Off'}",
+                f"Music Volume: {int(music_volume * 100)}%",
+                f"SFX Volume: {int(sfx_volume * 100)}%",
+            ]
+            self._audio_status_key = audio_key
+        for y, line in zip((310, 350, 390), self._audio_status_lines):
+            self.renderer.draw_text(self.screen, line, w//2, y, size=24, center=True)
+
+    def update_game(self, key_events: List[pygame.event.Event]) -> None:
         """Handle game state updates and collisions"""
-        w, h = self.screen.get_size()
-        if self.cell_size == 0:
-            self.cell_size = min(w // self.config.GRID_COLS, h // self.config.GRID_ROWS)
-            self.config.cell_size = self.cell_size
-            self.renderer.update_offsets(w, h)
+        w, h = self._screen_w, self._screen_h
 
         # Handle input
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == self.settings.get_key('UP'):
-                    self.snake.set_direction(Direction.UP)
-                elif event.key == self.settings.get_key('DOWN'):
-                    self.snake.set_direction(Direction.DOWN)
-                elif event.key == self.settings.get_key('LEFT'):
-                    self.snake.set_direction(Direction.LEFT)
-                elif event.key == self.settings.get_key('RIGHT'):
-                    self.snake.set_direction(Direction.RIGHT)
-                elif event.key == self.settings.get_key('PAUSE'):
-                    self.state = GameState.MENU
-                    self.sound_manager.play_menu_sound('select')
-                elif event.key == self.settings.get_key('QUIT'):
-                    self.cleanup()
-                    sys.exit()
-
-        # Update game logic at fixed rate
-        should_update = self.frame_count % (self.config.FPS // self.config.GAME_SPEED) == 0
-        if should_update:
-            self.game_tick += 1
-
-            # Dynamic Difficulty: Increase speed every SCORE_THRESHOLD points
-            if self.score > 0 and self.score % self.config.SCORE_THRESHOLD == 0:
-                self.config.GAME_SPEED = min(30, self.config.GAME_SPEED + self.config.SPEED_INCREMENT)
-                logging.info(f"Game speed increased to {self.config.GAME_SPEED}")
-
-            # Move obstacles
-            for obstacle in self.obstacles:
-                obstacle.move()
-
-            # Move snake and check collisions
-            if not self.snake.move(self.food_pos, { (ob.x, ob.y) for ob in self.obstacles }):
-                self.TEMP_SCORE = self.score
-                self.TEMP_MODE = "obstacles" if self.obstacles_enabled else "classic"
-                self.state = GameState.GAME_OVER
-                self.sound_manager.play_game_over_sound()
-                logging.info(f"Game Over! Score: {self.TEMP_SCORE}, Mode: {self.TEMP_MODE}")
+        self.refresh_keymaps()
+        for event in key_events:
+            action = self._game_keymap.get(event.key)
+            if action in self._ACTION_DIRECTIONS:
+                self.snake.set_direction(self._ACTION_DIRECTIONS[action])
+            elif action == 'PAUSE':
+                self.state = GameState.MENU
+                self.sound_manager.play_menu_sound('select')
+            elif action == 'QUIT':
+                self.cleanup()
+                sys.exit()
+
+        # Advance game logic on a fixed timestep, independent of the frame rate.
+        # Long stalls are clamped so the game doesn't fast-forward afterwards
+        self._tick_accumulator += min(self._frame_dt, self.MAX_FRAME_TIME)
+        while self._tick_accumulator >= 1.0 / self.config.GAME_SPEED:
+            self._tick_accumulator -= 1.0 / self.config.GAME_SPEED
+            if not self.tick_game():
                 return
 
-            # Play movement sound
-            self.sound_manager.play_movement_sound(self.config.GAME_SPEED)
-
-            # Check food collection
-            head = self.snake.head_position()
-            if head == self.food_pos:
-                bonus = (1 + self.config.OBSTACLE_BONUS) if self.obstacles_enabled else 1
-                self.score += bonus * self.score_multiplier
-                px = head[0] * self.cell_size + self.cell_size//2 + self.renderer.x_offset
-                py = head[1] * self.cell_size + self.cell_size//2 + self.renderer.y_offset
-                self.particles.emit(px, py, self.config.PARTICLE_COUNT, (255, 0, 0))  # Red particles for food
-                self.food_pos = self.get_random_position()
-                self.sound_manager.play_sound('food_pickup', self.sound_manager.pickup_channel)
-                logging.info(f"Food collected! New score: {self.score}")
-
         # Update power-ups
         self.powerup_manager.update(self)
 
@@ -1551,6 +1963,46 @@ class Game:
         self.renderer.draw_text(self.screen, f"Score: {self.score}", 10 + self.renderer.x_offset, 10 + self.renderer.y_offset, size=24)
         self.renderer.draw_text(self.screen, f"Multiplier: x{self.score_multiplier}", 10 + self.renderer.x_offset, 40 + self.renderer.y_offset, size=24)
 
+    def tick_game(self) -> bool:
+        """
+        Advance the game by one logic tick.
+        Returns False if the snake died and the game is over.
+        """
+        self.game_tick += 1
+
+        # Dynamic Difficulty: Increase speed every SCORE_THRESHOLD points
+        if self.score > 0 and self.score % self.config.SCORE_THRESHOLD == 0:
+            self.config.GAME_SPEED = min(30, self.config.GAME_SPEED + self.config.SPEED_INCREMENT)
+            logging.info(f"Game speed increased to {self.config.GAME_SPEED}")
+
+        # Move obstacles
+        self.obstacles.move()
+
+        # Move snake and check collisions
+        if not self.snake.move(self.food_pos, self.obstacles.positions):
+            self.TEMP_SCORE = self.score
+            self.TEMP_MODE = "obstacles" if self.obstacles_enabled else "classic"
+            self.state = GameState.GAME_OVER
+            self.sound_manager.play_game_over_sound()
+            logging.info(f"Game Over! Score: {self.TEMP_SCORE}, Mode: {self.TEMP_MODE}")
+            return False
+
+        # Play movement sound
+        self.sound_manager.play_movement_sound(self.config.GAME_SPEED)
+
+        # Check food collection
+        head = self.snake.head_position()
+        if head == self.food_pos:
+            bonus = (1 + self.config.OBSTACLE_BONUS) if self.obstacles_enabled else 1
+            self.score += bonus * self.score_multiplier
+            px = head[0] * self.cell_size + self.cell_size//2 + self.renderer.x_offset
+            py = head[1] * self.cell_size + self.cell_size//2 + self.renderer.y_offset
+            self.particles.emit(px, py, self.config.PARTICLE_COUNT, (255, 0, 0))  # Red particles for food
+            self.food_pos = self.get_random_position()
+            self.sound_manager.play_sound('food_pickup', self.sound_manager.pickup_channel)
+            logging.info(f"Food collected! New score: {self.score}")
+        return True
+
     def attract_food(self) -> None:
         """
         Move the food one step closer to the snake's head to simulate magnet effect.
@@ -1558,62 +2010,53 @@ class Game:
         """
         if not self.food_pos:
             return
-        snake_head = self.snake.head_position()
         fx, fy = self.food_pos
-        sx, sy = snake_head
-
+        sx, sy = self.snake.head_position()
         dx = sx - fx
         dy = sy - fy
 
-        move_x, move_y = 0, 0
-        if abs(dx) > abs(dy):
-            move_x = 1 if dx > 0 else -1 if dx < 0 else 0
-        else:
-            move_y = 1 if dy > 0 else -1 if dy < 0 else 0
-
-        new_food_pos = (fx + move_x, fy + move_y)
+        # Unit step along the axis with the greater distance
+        use_x = abs(dx) > abs(dy)
+        new_food_pos = (fx + ((dx > 0) - (dx < 0) if use_x else 0),
+                        fy + (0 if use_x else (dy > 0) - (dy < 0)))
 
-        # Check if the new position is valid
-        if (new_food_pos not in self.snake.body and
-            new_food_pos not in { (ob.x, ob.y) for ob in self.obstacles } and
-            new_food_pos not in [pu.position() for pu in self.powerup_manager.powerups ]):
+        # Only move onto a free cell
+        if (new_food_pos not in self.snake.body_cells and
+            new_food_pos not in self.obstacles.positions and
+            new_food_pos not in self.powerup_manager.powerup_by_pos):
             self.food_pos = new_food_pos
-            logging.info(f"Food attracted to {self.food_pos}")
-        else:
-            # If invalid, do not move
-            pass
+            logging.debug("Food attracted to %s", self.food_pos)
 
-    def update_game_over(self, events: List[pygame.event.Event]) -> None:
+    def update_game_over(self, key_events: List[pygame.event.Event]) -> None:
         """Handle game over state updates with name entry"""
-        w, h = self.screen.get_size()
+        w, h = self._screen_w, self._screen_h
         
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    final_name = Game.player_name.strip() or "Player"
-                    self.score_manager.add_score(final_name, self.TEMP_SCORE, self.TEMP_MODE)
-                    logging.info(f"High score added: {final_name} - {self.TEMP_SCORE} in {self.TEMP_MODE} mode.")
-                    Game.player_name = ""
-                    self.state = GameState.MENU
-                    self.sound_manager.play_menu_sound('select')
-                    self.sound_manager.resume_music()
-                elif event.key == pygame.K_h:
-                    final_name = Game.player_name.strip() or "Player"
-                    self.score_manager.add_score(final_name, self.TEMP_SCORE, self.TEMP_MODE)
-                    logging.info(f"High score added: {final_name} - {self.TEMP_SCORE} in {self.TEMP_MODE} mode.")
-                    Game.player_name = ""
-                    self.state = GameState.HIGHSCORES
-                    self.sound_manager.play_menu_sound('select')
-                elif event.key == pygame.K_ESCAPE:
-                    Game.player_name = ""
-                    self.state = GameState.MENU
-                    self.sound_manager.play_menu_sound('select')
-                    self.sound_manager.resume_music()
-                elif event.key == pygame.K_BACKSPACE:
-                    Game.player_name = Game.player_name[:-1]
-                else:
-                    if len(Game.player_name) < 15 and event.unicode.isprintable():
-                        Game.player_name += event.unicode
+        for event in key_events:
+            if event.key == pygame.K_RETURN:
+                final_name = Game.player_name.strip() or "Player"
+                self.score_manager.add_score(final_name, self.TEMP_SCORE, self.TEMP_MODE)
+                logging.info(f"High score added: {final_name} - {self.TEMP_SCORE} in {self.TEMP_MODE} mode.")
+                Game.player_name = ""
+                self.state = GameState.MENU
+                self.sound_manager.play_menu_sound('select')
+                self.sound_manager.resume_music()
+            elif event.key == pygame.K_h:
+                final_name = Game.player_name.strip() or "Player"
+                self.score_manager.add_score(final_name, self.TEMP_SCORE, self.TEMP_MODE)
+                logging.info(f"High score added: {final_name} - {self.TEMP_SCORE} in {self.TEMP_MODE} mode.")
+                Game.player_name = ""
+                self.state = GameState.HIGHSCORES
+                self.sound_manager.play_menu_sound('select')
+            elif event.key == pygame.K_ESCAPE:
+                Game.player_name = ""
+                self.state = GameState.MENU
+                self.sound_manager.play_menu_sound('select')
+                self.sound_manager.resume_music()
+            elif event.key == pygame.K_BACKSPACE:
+                Game.player_name = Game.player_name[:-1]
+            else:
+                if len(Game.player_name) < 15 and event.unicode.isprintable():
+                    Game.player_name += event.unicode
 
         # Draw game over screen
         self.renderer.draw_background(self.screen, w, h)
@@ -1635,17 +2078,17 @@ class Game:
                               w//2, h//2 + 70, size=20, 
                               color=self.config.WHITE, center=True)
 
-    def update_highscores(self, events: List[pygame.event.Event]) -> None:
+    def update_highscores(self, key_events: List[pygame.event.Event]) -> None:
         """Handle highscores state updates and rendering"""
-        w, h = self.screen.get_size()
+        self.refresh_menu_labels()
+        w, h = self._screen_w, self._screen_h
 
         # Handle input
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.state = GameState.MENU
-                    self.sound_manager.play_menu_sound('select')
-                    return
+        for event in key_events:
+            if event.key == pygame.K_ESCAPE:
+                self.state = GameState.MENU
+                self.sound_manager.play_menu_sound('select')
+                return
 
         # Draw background and overlay
         self.renderer.draw_background(self.screen, w, h)
@@ -1657,9 +2100,14 @@ class Game:
                               color=self.config.BLUE,
                               center=True, glow=True)
 
-        # Get scores for both modes
-        classic_scores = self.score_manager.highscores.get("classic", [])
-        obstacle_scores = self.score_manager.highscores.get("obstacles", [])
+        # Get formatted score lines for both modes
+        if self.score_manager.version != self._highscore_lines_version:
+            self._highscore_lines = {
+                mode: [f"{i+1}. {entry['name']} - {entry['score']}"
+                       for i, entry in enumerate(self.score_manager.highscores.get(mode, []))]
+                for mode in ("classic", "obstacles")
+            }
+            self._highscore_lines_version = self.score_manager.version
 
         # Draw Classic Mode scores
         y_offset = 100
@@ -1667,8 +2115,7 @@ class Game:
                               w//2, y_offset, size=28, center=True)
         y_offset += 40
         
-        for i, entry in enumerate(classic_scores):
-            score_text = f"{i+1}. {entry['name']} - {entry['score']}"
+        for score_text in self._highscore_lines["classic"]:
             self.renderer.draw_text(self.screen, score_text,
                                   w//2, y_offset, size=24, center=True)
             y_offset += 30
@@ -1679,18 +2126,18 @@ class Game:
                               w//2, y_offset, size=28, center=True)
         y_offset += 40
         
-        for i, entry in enumerate(obstacle_scores):
-            score_text = f"{i+1}. {entry['name']} - {entry['score']}"
+        for score_text in self._highscore_lines["obstacles"]:
             self.renderer.draw_text(self.screen, score_text,
                                   w//2, y_offset, size=24, center=True)
             y_offset += 30
 
         # Draw return instruction
-        self.renderer.draw_text(self.screen, f"[{pygame.key.name(self.settings.get_key('QUIT')).upper()}] Return to Menu",
+        self.renderer.draw_text(self.screen, self._menu_labels['return'],
                               w//2, h - 30, size=24, center=True)
 
     def cleanup(self) -> None:
         """Clean up resources before exit"""
+        self.settings.flush()
         self.resources.cleanup()
         self.sound_manager.cleanup()
         pygame.quit()